@@ -0,0 +1,119 @@
+"""
+In-process response cache for read-heavy project endpoints.
+
+Entries are grouped by namespace (``project:<id>``) and dropped whenever a
+committed ORM change touches that project. Readers take a generation token
+before computing a payload and pass it to ``set()``; if an invalidation
+happened in between, the (possibly stale) payload is not stored. The TTL
+bounds staleness for writes made by other workers or outside the ORM.
+"""
+
+import threading
+import time
+from typing import Any, Hashable
+
+from app import models
+from app.core.settings import settings
+from app.db import SessionLocal
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+_PENDING_KEY = "response_cache_pending_namespaces"
+_CLEAR_ALL = "*"
+
+
+def project_namespace(project_id: int) -> str:
+    return f"project:{project_id}"
+
+
+class ResponseCache:
+    """Thread-safe TTL cache with namespace invalidation."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 1024) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: dict[tuple[str, Hashable], tuple[float, Any]] = {}
+        self._generations: dict[str, int] = {}
+        self._epoch = 0
+        self._lock = threading.Lock()
+
+    def generation(self, namespace: str) -> tuple[int, int]:
+        """Token to take before computing a payload that will be passed to ``set()``."""
+        with self._lock:
+            return self._epoch, self._generations.get(namespace, 0)
+
+    def get(self, namespace: str, key: Hashable) -> Any | None:
+        if self.ttl_seconds <= 0:
+            return None
+        with self._lock:
+            entry = self._entries.get((namespace, key))
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[(namespace, key)]
+                return None
+            return value
+
+    def set(self, namespace: str, key: Hashable, value: Any, generation: tuple[int, int]) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            if generation != (self._epoch, self._generations.get(namespace, 0)):
+                # Invalidated while the payload was being computed: it may be stale.
+                return
+            if len(self._entries) >= self.max_entries:
+                self._entries.clear()
+            self._entries[(namespace, key)] = (time.monotonic() + self.ttl_seconds, value)
+
+    def invalidate(self, namespace: str) -> None:
+        with self._lock:
+            self._generations[namespace] = self._generations.get(namespace, 0) + 1
+            for cache_key in [k for k in self._entries if k[0] == namespace]:
+                del self._entries[cache_key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._epoch += 1
+            self._generations.clear()
+            self._entries.clear()
+
+
+response_cache = ResponseCache(ttl_seconds=settings.response_cache_ttl_seconds)
+
+
+def _namespaces_for(obj: Any) -> set[str]:
+    if isinstance(obj, models.Project):
+        return {project_namespace(obj.id)} if obj.id is not None else set()
+    if isinstance(obj, models.FlowsheetVersion):
+        # Versions are shared between projects and shown on every linked dashboard.
+        return {_CLEAR_ALL}
+    project_id = getattr(obj, "project_id", None)
+    return {project_namespace(project_id)} if project_id is not None else set()
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def _collect_touched_projects(session: Session, flush_context: Any) -> None:
+    pending = session.info.setdefault(_PENDING_KEY, set())
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        pending |= _namespaces_for(obj)
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _invalidate_touched_projects(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+    if _CLEAR_ALL in pending:
+        response_cache.clear()
+        return
+    for namespace in pending:
+        response_cache.invalidate(namespace)
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_touched_projects(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+__all__ = ["ResponseCache", "project_namespace", "response_cache"]
@@ -0,0 +1,16 @@
+"""
+Response helpers for read-heavy endpoints.
+"""
+
+from fastapi import Response
+from pydantic import BaseModel
+
+
+def model_json_response(payload: BaseModel) -> Response:
+    """
+    Serialize an already-built response model straight to JSON.
+
+    Returning a Response bypasses FastAPI's dump -> revalidate -> jsonable_encoder
+    round-trip for response_model; the route's response_model still documents it.
+    """
+    return Response(content=payload.model_dump_json(), media_type="application/json")
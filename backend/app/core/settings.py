@@ -25,6 +25,9 @@ class Settings(BaseSettings):
     # Вкл/выкл обязательной авторизации (для локальной разработки по умолчанию выключено)
     auth_enabled: bool = False
 
+    # TTL (секунды) in-process кеша ответов /projects/{id}/summary и /dashboard; 0 — выключить
+    response_cache_ttl_seconds: float = 30.0
+
     # Настройки pydantic-settings (v2)
     model_config = SettingsConfigDict(
         env_file=".env",  # читаем переменные из .env
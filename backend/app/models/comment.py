@@ -1,7 +1,17 @@
 import uuid
 
 from app.db import Base
-from sqlalchemy import CheckConstraint, Column, DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import (
+    CheckConstraint,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -27,4 +37,6 @@ class Comment(Base):
             "(scenario_id IS NULL AND calc_run_id IS NOT NULL)",
             name="comment_single_target",
         ),
+        # Project dashboard/summary: latest comments and MAX(created_at) per project.
+        Index("ix_comment_project_id_created_at", project_id, created_at.desc()),
     )
@@ -143,12 +143,6 @@ def get_me_summary(
         .scalar()
     ) or 0
 
-    calc_runs_total = (
-        db.query(func.count(models.CalcRun.id))
-        .filter(models.CalcRun.started_by_user_id == current_user.id)
-        .scalar()
-    ) or 0
-
     status_rows = (
         db.query(models.CalcRun.status, func.count(models.CalcRun.id))
         .filter(models.CalcRun.started_by_user_id == current_user.id)
@@ -156,6 +150,8 @@ def get_me_summary(
         .all()
     )
     calc_runs_by_status = {status: count for status, count in status_rows if status is not None}
+    # The grouped counts already add up to the total; no second COUNT over calc_run.
+    calc_runs_total = sum(count for _, count in status_rows)
 
     comments_total = (
         db.query(func.count(models.Comment.id))
@@ -1,6 +1,7 @@
 import uuid
 
 from app import models
+from app.core.responses import model_json_response
 from app.db import get_db
 from app.schemas import (
     CalcComparisonCreate,
@@ -9,11 +10,10 @@ from app.schemas import (
     CalcComparisonListResponse,
     CalcComparisonRead,
     CalcRunCompareResponse,
-    CalcRunComparisonItem,
 )
-from app.schemas.calc_io import CalcInput, CalcResultSummary
+from app.schemas.calc_run import comparison_items_from_runs
 from app.services.calc_service import get_flowsheet_version_or_404
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
@@ -33,25 +33,7 @@ def _build_compare_response(
 
     run_map = {run.id: run for run in runs}
     ordered_runs = [run_map[run_id] for run_id in run_ids if run_id in run_map]
-    items: list[CalcRunComparisonItem] = []
-    for run in ordered_runs:
-        input_model = CalcInput.model_validate(run.input_json)
-        result_model = (
-            CalcResultSummary.model_validate(run.result_json)
-            if run.result_json is not None
-            else None
-        )
-        items.append(
-            CalcRunComparisonItem(
-                id=run.id,
-                scenario_id=run.scenario_id,
-                status=run.status,
-                started_at=run.started_at,
-                finished_at=run.finished_at,
-                input=input_model,
-                result=result_model,
-            )
-        )
+    items = comparison_items_from_runs(ordered_runs)
 
     return CalcRunCompareResponse(items=items, total=len(items))
 
@@ -106,7 +88,7 @@ def get_calc_comparison(
     comparison_id: uuid.UUID,
     only_success: bool = Query(True, description="Whether to include only successful runs"),
     db: Session = Depends(get_db),
-) -> CalcComparisonDetailResponse:
+) -> Response:
     comparison = db.get(models.CalcComparison, comparison_id)
     if not comparison:
         raise HTTPException(status_code=404, detail="CalcComparison not found")
@@ -130,7 +112,11 @@ def get_calc_comparison(
         }
     )
 
-    return CalcComparisonDetailResponse(comparison=comparison_read, runs=runs_response)
+    # The nested models are already validated; serialize once instead of letting
+    # response_model revalidate every run item.
+    return model_json_response(
+        CalcComparisonDetailResponse(comparison=comparison_read, runs=runs_response)
+    )
 
 
 @router.get(
@@ -5,9 +5,10 @@ from uuid import UUID as _UUID
 
 from app import models
 from app.core.engine.executor import execute_flowsheet
+from app.core.responses import model_json_response
 from app.db import get_db
 from app.routers.auth import get_current_user
-from app.schemas.calc_io import CalcInput, CalcResultSummary
+from app.schemas.calc_io import CalcResultSummary
 from app.schemas.calc_run import (
     BatchRunRequest,
     BatchRunResponse,
@@ -19,9 +20,10 @@ from app.schemas.calc_run import (
     CalcRunListItem,
     CalcRunListResponse,
     CalcRunRead,
+    comparison_items_from_runs,
 )
 from app.services.calc_service import get_calc_scenario_or_404, get_flowsheet_version_or_404
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from pydantic import BaseModel, Field
 from sqlalchemy import func
 from sqlalchemy.orm import Session, joinedload
@@ -29,22 +31,6 @@ from sqlalchemy.orm import Session, joinedload
 router = APIRouter(prefix="/api/calc-runs", tags=["calc-runs"])
 
 
-def _to_comparison_item(run: models.CalcRun) -> CalcRunComparisonItem:
-    input_model = CalcInput.model_validate(run.input_json)
-    result_model = (
-        CalcResultSummary.model_validate(run.result_json) if run.result_json is not None else None
-    )
-    return CalcRunComparisonItem(
-        id=run.id,
-        scenario_id=run.scenario_id,
-        status=run.status,
-        started_at=run.started_at,
-        finished_at=run.finished_at,
-        input=input_model,
-        result=result_model,
-    )
-
-
 def _compute_deltas(
     baseline: CalcRunComparisonItem, run_item: CalcRunComparisonItem
 ) -> CalcRunDelta:
@@ -100,7 +86,7 @@ def list_calc_runs(
         None, description="Upper bound for started_at (inclusive)"
     ),
     db: Session = Depends(get_db),
-) -> CalcRunListResponse:
+) -> Response:
     get_flowsheet_version_or_404(db, flowsheet_version_id)
     query = db.query(models.CalcRun).filter(
         models.CalcRun.flowsheet_version_id == flowsheet_version_id
@@ -125,8 +111,8 @@ def list_calc_runs(
         .all()
     )
 
-    items = [CalcRunListItem.model_validate(run, from_attributes=True) for run in runs]
-    return CalcRunListResponse(items=items, total=total)
+    items = [CalcRunListItem.from_orm_trusted(run) for run in runs]
+    return model_json_response(CalcRunListResponse(items=items, total=total))
 
 
 @router.get("/my", response_model=CalcRunListResponse)
@@ -136,7 +122,7 @@ def get_my_calc_runs(
     status: Optional[str] = Query(None, description="Optional status filter"),
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
-) -> CalcRunListResponse:
+) -> Response:
     # Start with base query
     base_query = db.query(models.CalcRun).filter(
         models.CalcRun.started_by_user_id == current_user.id
@@ -159,8 +145,8 @@ def get_my_calc_runs(
         .limit(limit)
         .all()
     )
-    items = [CalcRunListItem.model_validate(run, from_attributes=True) for run in runs]
-    return CalcRunListResponse(items=items, total=total)
+    items = [CalcRunListItem.from_orm_trusted(run) for run in runs]
+    return model_json_response(CalcRunListResponse(items=items, total=total))
 
 
 @router.get(
@@ -193,7 +179,7 @@ def get_latest_calc_run_by_scenario(
             status_code=404, detail=f"No calc runs found for scenario {scenario_id}"
         )
 
-    return CalcRunRead.model_validate(calc_run, from_attributes=True)
+    return CalcRunRead.from_orm_trusted(calc_run)
 
 
 @router.get("/compare", response_model=CalcRunCompareResponse)
@@ -201,7 +187,7 @@ def compare_calc_runs(
     run_ids: Optional[list[uuid.UUID]] = Query(default=None),
     only_success: bool = Query(True, description="Whether to include only successful runs"),
     db: Session = Depends(get_db),
-) -> CalcRunCompareResponse:
+) -> Response:
     if not run_ids:
         raise HTTPException(status_code=400, detail="run_ids query parameter is required")
 
@@ -215,27 +201,9 @@ def compare_calc_runs(
 
     run_map = {run.id: run for run in runs}
     ordered_runs = [run_map[run_id] for run_id in run_ids if run_id in run_map]
-    items: list[CalcRunComparisonItem] = []
-    for run in ordered_runs:
-        input_model = CalcInput.model_validate(run.input_json)
-        result_model = (
-            CalcResultSummary.model_validate(run.result_json)
-            if run.result_json is not None
-            else None
-        )
-        items.append(
-            CalcRunComparisonItem(
-                id=run.id,
-                scenario_id=run.scenario_id,
-                status=run.status,
-                started_at=run.started_at,
-                finished_at=run.finished_at,
-                input=input_model,
-                result=result_model,
-            )
-        )
+    items = comparison_items_from_runs(ordered_runs)
 
-    return CalcRunCompareResponse(items=items, total=len(items))
+    return model_json_response(CalcRunCompareResponse(items=items, total=len(items)))
 
 
 @router.get("/compare-with-baseline", response_model=CalcRunCompareWithBaselineResponse)
@@ -244,7 +212,7 @@ def compare_calc_runs_with_baseline(
     run_ids: Optional[list[uuid.UUID]] = Query(default=None),
     only_success: bool = Query(True, description="Whether to include only successful runs"),
     db: Session = Depends(get_db),
-) -> CalcRunCompareWithBaselineResponse:
+) -> Response:
     if not run_ids:
         raise HTTPException(status_code=400, detail="run_ids query parameter is required")
 
@@ -269,17 +237,20 @@ def compare_calc_runs_with_baseline(
                 detail="All runs must belong to the same flowsheet version as baseline",
             )
 
-    baseline_item = _to_comparison_item(baseline_run)
     run_map = {run.id: run for run in runs}
     ordered_runs = [run_map[rid] for rid in run_ids if rid in run_map]
+    baseline_item, *run_items = comparison_items_from_runs([baseline_run, *ordered_runs])
 
-    items: list[CalcRunCompareWithBaselineItem] = []
-    for run in ordered_runs:
-        run_item = _to_comparison_item(run)
-        deltas = _compute_deltas(baseline_item, run_item)
-        items.append(CalcRunCompareWithBaselineItem(run=run_item, deltas=deltas))
+    items = [
+        CalcRunCompareWithBaselineItem(
+            run=run_item, deltas=_compute_deltas(baseline_item, run_item)
+        )
+        for run_item in run_items
+    ]
 
-    return CalcRunCompareWithBaselineResponse(baseline=baseline_item, items=items, total=len(items))
+    return model_json_response(
+        CalcRunCompareWithBaselineResponse(baseline=baseline_item, items=items, total=len(items))
+    )
 
 
 @router.get(
@@ -294,7 +265,7 @@ def get_calc_run_by_id(
     calc_run = db.get(models.CalcRun, calc_run_id)
     if calc_run is None:
         raise HTTPException(status_code=404, detail="Calc run not found")
-    return CalcRunRead.model_validate(calc_run, from_attributes=True)
+    return CalcRunRead.from_orm_trusted(calc_run)
 
 
 # ============================================================================
@@ -380,7 +351,7 @@ def run_and_save(
     db.commit()
     db.refresh(calc_run)
 
-    return CalcRunRead.model_validate(calc_run, from_attributes=True)
+    return CalcRunRead.from_orm_trusted(calc_run)
 
 
 @router.post(
@@ -449,7 +420,7 @@ def batch_run_scenarios(
 
         db.add(calc_run)
         db.flush()
-        created_runs.append(CalcRunRead.model_validate(calc_run, from_attributes=True))
+        created_runs.append(CalcRunRead.from_orm_trusted(calc_run))
 
     db.commit()
 
@@ -3,6 +3,7 @@ from datetime import datetime, timezone
 from typing import Optional
 
 from app import models
+from app.core.responses import model_json_response
 from app.db import get_db
 from app.routers.auth import get_current_user_optional
 from app.schemas.calc_scenario import (
@@ -18,9 +19,10 @@ from app.services.calc_service import (
     get_flowsheet_version_or_404,
     validate_input_json,
 )
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy import func
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Query as ORMQuery
+from sqlalchemy.orm import Session
 
 router = APIRouter(prefix="/api/calc-scenarios", tags=["calc-scenarios"])
 
@@ -136,6 +138,24 @@ def get_calc_scenario(scenario_id: uuid.UUID, db: Session = Depends(get_db)) ->
     return scenario
 
 
+# List items only need a handful of columns: select just those instead of loading
+# full CalcScenario entities (with their default_input_json blobs).
+_LIST_ITEM_COLUMNS = tuple(
+    getattr(models.CalcScenario, name) for name in CalcScenarioListItem.model_fields
+)
+
+
+def _list_items_page(query: ORMQuery, offset: int, limit: int) -> list[CalcScenarioListItem]:
+    rows = (
+        query.with_entities(*_LIST_ITEM_COLUMNS)
+        .order_by(models.CalcScenario.created_at.desc())
+        .offset(offset)
+        .limit(limit)
+        .all()
+    )
+    return [CalcScenarioListItem.from_orm_trusted(row) for row in rows]
+
+
 @router.get(
     "/by-flowsheet-version/{flowsheet_version_id}",
     response_model=CalcScenarioListResponse,
@@ -146,7 +166,7 @@ def list_calc_scenarios(
     offset: int = 0,
     project_id: Optional[int] = None,
     db: Session = Depends(get_db),
-) -> CalcScenarioListResponse:
+) -> Response:
     get_flowsheet_version_or_404(db, flowsheet_version_id)
     query = db.query(models.CalcScenario).filter(
         models.CalcScenario.flowsheet_version_id == flowsheet_version_id
@@ -157,14 +177,8 @@ def list_calc_scenarios(
         query = query.filter(models.CalcScenario.project_id == project_id)
 
     total = query.with_entities(func.count()).scalar() or 0
-    scenarios = (
-        query.order_by(models.CalcScenario.created_at.desc()).offset(offset).limit(limit).all()
-    )
-    items = [
-        CalcScenarioListItem.model_validate(scenario, from_attributes=True)
-        for scenario in scenarios
-    ]
-    return CalcScenarioListResponse(items=items, total=total)
+    items = _list_items_page(query, offset, limit)
+    return model_json_response(CalcScenarioListResponse(items=items, total=total))
 
 
 @router.get("/by-project/{project_id}", response_model=CalcScenarioListResponse)
@@ -176,7 +190,7 @@ def list_calc_scenarios_by_project(
     limit: int = 50,
     offset: int = 0,
     db: Session = Depends(get_db),
-) -> CalcScenarioListResponse:
+) -> Response:
     project = _get_project_or_404(db, project_id)
     base_query = db.query(models.CalcScenario).filter(models.CalcScenario.project_id == project.id)
     if flowsheet_version_id:
@@ -186,23 +200,9 @@ def list_calc_scenarios_by_project(
             models.CalcScenario.flowsheet_version_id == flowsheet_version_id
         )
 
-    # Count before joinedload
     total = base_query.with_entities(func.count()).scalar() or 0
-
-    # Apply joinedload
-    query = base_query.options(
-        joinedload(models.CalcScenario.project),
-        joinedload(models.CalcScenario.flowsheet_version),
-    )
-
-    scenarios = (
-        query.order_by(models.CalcScenario.created_at.desc()).offset(offset).limit(limit).all()
-    )
-    items = [
-        CalcScenarioListItem.model_validate(scenario, from_attributes=True)
-        for scenario in scenarios
-    ]
-    return CalcScenarioListResponse(items=items, total=total)
+    items = _list_items_page(base_query, offset, limit)
+    return model_json_response(CalcScenarioListResponse(items=items, total=total))
 
 
 @router.patch("/{scenario_id}", response_model=CalcScenarioRead)
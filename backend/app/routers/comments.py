@@ -4,10 +4,11 @@ from typing import Tuple
 
 from app import models
 from app.core.exceptions import raise_bad_request, raise_not_found, raise_permission_denied
+from app.core.responses import model_json_response
 from app.db import get_db
 from app.routers.auth import get_current_user_optional
 from app.schemas import CommentCreate, CommentListResponse, CommentRead
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
@@ -102,7 +103,7 @@ def _list_comments(
     scenario_id: uuid.UUID | None = None,
     calc_run_id: uuid.UUID | None = None,
     limit: int,
-) -> CommentListResponse:
+) -> Response:
     query = db.query(models.Comment).filter(models.Comment.project_id == project.id)
     if scenario_id:
         query = query.filter(models.Comment.scenario_id == scenario_id)
@@ -115,8 +116,8 @@ def _list_comments(
         .limit(limit)
         .all()
     )
-    items = [CommentRead.model_validate(comment, from_attributes=True) for comment in comments]
-    return CommentListResponse(items=items, total=total)
+    items = [CommentRead.from_orm_trusted(comment) for comment in comments]
+    return model_json_response(CommentListResponse(items=items, total=total))
 
 
 @router.get("/projects/{project_id}/comments", response_model=CommentListResponse)
@@ -125,7 +126,7 @@ def list_project_comments(
     limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
     db: Session = Depends(get_db),
     current_user: models.User | None = Depends(get_current_user_optional),
-) -> CommentListResponse:
+) -> Response:
     project = _get_project_or_404(db, project_id)
     _check_project_read_access(db, project, current_user)
     return _list_comments(db, project, limit=limit)
@@ -158,7 +159,7 @@ def create_project_comment(
     db.add(comment)
     db.commit()
     db.refresh(comment)
-    return CommentRead.model_validate(comment, from_attributes=True)
+    return CommentRead.from_orm_trusted(comment)
 
 
 @router.get("/scenarios/{scenario_id}/comments", response_model=CommentListResponse)
@@ -167,7 +168,7 @@ def list_scenario_comments(
     limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
     db: Session = Depends(get_db),
     current_user: models.User | None = Depends(get_current_user_optional),
-) -> CommentListResponse:
+) -> Response:
     scenario = db.get(models.CalcScenario, scenario_id)
     if scenario is None:
         raise_not_found("CalcScenario", scenario_id)
@@ -182,7 +183,7 @@ def list_calc_run_comments(
     limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
     db: Session = Depends(get_db),
     current_user: models.User | None = Depends(get_current_user_optional),
-) -> CommentListResponse:
+) -> Response:
     calc_run = db.get(models.CalcRun, run_id)
     if calc_run is None:
         raise_not_found("CalcRun", run_id)
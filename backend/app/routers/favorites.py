@@ -138,8 +138,8 @@ def get_dashboard(
 
     favorites_grouped = UserFavoritesGrouped(
         projects=[ProjectRead.model_validate(p, from_attributes=True) for p in projects],
-        scenarios=[CalcScenarioRead.model_validate(s, from_attributes=True) for s in scenarios],
-        calc_runs=[CalcRunListItem.model_validate(r, from_attributes=True) for r in runs],
+        scenarios=[CalcScenarioRead.from_orm_trusted(s) for s in scenarios],
+        calc_runs=[CalcRunListItem.from_orm_trusted(r) for r in runs],
     )
 
     summary = UserActivitySummary(
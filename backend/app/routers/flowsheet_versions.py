@@ -170,9 +170,7 @@ def clone_flowsheet_version(
 
     return FlowsheetVersionCloneResponse(
         flowsheet_version=FlowsheetVersionRead.model_validate(cloned_version, from_attributes=True),
-        scenarios=[
-            CalcScenarioRead.model_validate(s, from_attributes=True) for s in cloned_scenarios
-        ],
+        scenarios=[CalcScenarioRead.from_orm_trusted(s) for s in cloned_scenarios],
     )
 
 
@@ -226,12 +224,8 @@ def get_flowsheet_version_overview(
         latest_run = latest_runs_map.get(scenario.id)
         scenario_items.append(
             ScenarioWithLatestRun(
-                scenario=CalcScenarioListItem.model_validate(scenario, from_attributes=True),
-                latest_run=(
-                    CalcRunRead.model_validate(latest_run, from_attributes=True)
-                    if latest_run
-                    else None
-                ),
+                scenario=CalcScenarioListItem.from_orm_trusted(scenario),
+                latest_run=(CalcRunRead.from_orm_trusted(latest_run) if latest_run else None),
             )
         )
 
@@ -296,12 +290,12 @@ def export_flowsheet_version_bundle(
             flowsheet_version, from_attributes=True
         ),
         units=[UnitRead.model_validate(unit, from_attributes=True) for unit in units],
-        scenarios=[CalcScenarioRead.model_validate(s, from_attributes=True) for s in scenarios],
-        runs=[CalcRunRead.model_validate(r, from_attributes=True) for r in runs],
+        scenarios=[CalcScenarioRead.from_orm_trusted(s) for s in scenarios],
+        runs=[CalcRunRead.from_orm_trusted(r) for r in runs],
         comparisons=[
             CalcComparisonRead.model_validate(c, from_attributes=True) for c in comparisons
         ],
-        comments=[CommentRead.model_validate(c, from_attributes=True) for c in comments],
+        comments=[CommentRead.from_orm_trusted(c) for c in comments],
     )
 
 
@@ -1,6 +1,7 @@
 import uuid
 
 from app import models
+from app.core.cache import project_namespace, response_cache
 from app.core.exceptions import (
     raise_bad_request,
     raise_internal_error,
@@ -29,6 +30,7 @@ from app.schemas import (
 from app.schemas.calc_run import CalcRunListItem
 from app.schemas.calc_scenario import CalcScenarioRead
 from app.schemas.comment import CommentRead
+from app.schemas.enums import CalcRunStatus
 from app.schemas.user import UserRead
 from app.services.project_service import (
     attach_flowsheet_version_to_project as attach_link_to_project,
@@ -41,11 +43,17 @@ from app.services.run_metrics import (
     is_grind_mvp_run,
 )
 from fastapi import APIRouter, Depends, Query, Response, status
-from sqlalchemy import func, or_
-from sqlalchemy.orm import Session, joinedload
+from pydantic import TypeAdapter
+from sqlalchemy import and_, exists, func, insert, or_, select
+from sqlalchemy.orm import Session, aliased, joinedload, raiseload
 
 router = APIRouter(prefix="/api/projects", tags=["projects"])
 
+# List validators are built once; validating a whole list in one call avoids
+# re-entering the per-model validator for every row.
+_PROJECT_LIST_ADAPTER = TypeAdapter(list[ProjectRead])
+_FLOWSHEET_VERSION_LIST_ADAPTER = TypeAdapter(list[FlowsheetVersionRead])
+
 
 @router.get("", response_model=PaginatedResponse[ProjectRead])
 def list_projects(
@@ -83,7 +91,7 @@ def list_projects(
         total=total,
         skip=skip,
         limit=limit,
-        items=[ProjectRead.model_validate(p, from_attributes=True) for p in projects],
+        items=_PROJECT_LIST_ADAPTER.validate_python(projects, from_attributes=True),
     )
 
 
@@ -187,6 +195,7 @@ def _load_project_flowsheet_versions(
 ) -> list[ProjectFlowsheetVersionRead]:
     rows = (
         db.query(models.ProjectFlowsheetVersion, models.FlowsheetVersion, models.Flowsheet)
+        .options(raiseload("*"))
         .join(
             models.FlowsheetVersion,
             models.ProjectFlowsheetVersion.flowsheet_version_id == models.FlowsheetVersion.id,
@@ -239,6 +248,7 @@ def _build_project_detail(db: Session, project: models.Project) -> ProjectDetail
         db.query(
             models.ProjectFlowsheetVersion, models.FlowsheetVersion, models.Flowsheet, models.Plant
         )
+        .options(raiseload("*"))
         .join(
             models.FlowsheetVersion,
             models.ProjectFlowsheetVersion.flowsheet_version_id == models.FlowsheetVersion.id,
@@ -328,14 +338,14 @@ def _check_project_read_access(
         raise_permission_denied(action=f"view project '{project.name}' (login required)")
     if project.owner_user_id == user.id:
         return
-    membership = (
-        db.query(models.ProjectMember)
-        .filter(
-            models.ProjectMember.project_id == project.id, models.ProjectMember.user_id == user.id
+    # Existence probe only: served from the (project_id, user_id) primary key index.
+    is_member = db.query(
+        exists().where(
+            models.ProjectMember.project_id == project.id,
+            models.ProjectMember.user_id == user.id,
         )
-        .first()
-    )
-    if membership is None:
+    ).scalar()
+    if not is_member:
         raise_permission_denied(action=f"view project '{project.name}'")
 
 
@@ -363,6 +373,10 @@ def get_my_projects(
     current_user: models.User | None = Depends(get_current_user_optional),
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: int | None = Query(
+        default=None,
+        description="Keyset cursor: id of the last project of the previous page (overrides offset)",
+    ),
 ) -> ProjectListResponse:
     base_query = db.query(models.Project)
     if current_user is None:
@@ -372,14 +386,32 @@ def get_my_projects(
 
     total = base_query.count()
 
-    # Apply joinedload for potential future use
-    query = base_query.options(
-        joinedload(models.Project.owner),
-        joinedload(models.Project.plant),
-    )
-    items = query.order_by(models.Project.created_at.desc()).offset(offset).limit(limit).all()
-    dto_items = [ProjectRead.model_validate(item, from_attributes=True) for item in items]
-    return ProjectListResponse(items=dto_items, total=total)
+    query = base_query.order_by(models.Project.created_at.desc(), models.Project.id.desc())
+    if cursor is not None:
+        # Keyset pagination: seek past the cursor row instead of scanning and skipping.
+        # The anchor is looked up through base_query so it is scoped to the caller.
+        if not base_query.filter(models.Project.id == cursor).count():
+            raise_bad_request(f"Invalid cursor: project {cursor} not found")
+        # Compare column-to-column so the stored timestamp format never matters.
+        anchor = aliased(models.Project)
+        anchor_created_at = select(anchor.created_at).where(anchor.id == cursor).scalar_subquery()
+        query = query.filter(
+            or_(
+                models.Project.created_at < anchor_created_at,
+                and_(
+                    models.Project.created_at == anchor_created_at,
+                    models.Project.id < cursor,
+                ),
+            )
+        )
+    else:
+        query = query.offset(offset)
+
+    # Fetch one extra row to know whether another page exists.
+    items = query.limit(limit + 1).all()
+    next_cursor = items[limit - 1].id if len(items) > limit else None
+    dto_items = _PROJECT_LIST_ADAPTER.validate_python(items[:limit], from_attributes=True)
+    return ProjectListResponse(items=dto_items, total=total, next_cursor=next_cursor)
 
 
 @router.post("/demo-seed", response_model=ProjectRead, status_code=status.HTTP_200_OK)
@@ -515,13 +547,23 @@ def get_project_detail(
     return _build_project_detail(db, project)
 
 
+def _linked_version_ids(project_id: int):
+    """
+    Subquery over the project's flowsheet version links.
+
+    Filtering by this instead of a literal id list keeps the SQL text (and the
+    server-side plan) identical no matter how many versions are attached.
+    """
+    return select(models.ProjectFlowsheetVersion.flowsheet_version_id).where(
+        models.ProjectFlowsheetVersion.project_id == project_id
+    )
+
+
 def _calculate_project_summary(
     db: Session,
     project: models.Project,
     flowsheet_version_ids: list[uuid.UUID],
-    current_user: models.User,
 ) -> ProjectSummary:
-    _check_project_read_access(db, project, current_user)
     if not flowsheet_version_ids:
         return ProjectSummary(
             project=ProjectRead.model_validate(project, from_attributes=True),
@@ -533,82 +575,48 @@ def _calculate_project_summary(
             last_activity_at=None,
         )
 
-    scenarios_total = (
-        db.query(func.count(models.CalcScenario.id))
-        .filter(
-            models.CalcScenario.flowsheet_version_id.in_(flowsheet_version_ids),
-            models.CalcScenario.project_id == project.id,
-        )
-        .scalar()
-        or 0
-    )
-
-    calc_runs_total = (
-        db.query(func.count(models.CalcRun.id))
-        .filter(
-            models.CalcRun.flowsheet_version_id.in_(flowsheet_version_ids),
-            models.CalcRun.project_id == project.id,
-        )
-        .scalar()
-        or 0
-    )
-
-    status_rows = (
-        db.query(models.CalcRun.status, func.count(models.CalcRun.id))
-        .filter(
-            models.CalcRun.flowsheet_version_id.in_(flowsheet_version_ids),
-            models.CalcRun.project_id == project.id,
-        )
-        .group_by(models.CalcRun.status)
-        .all()
+    scenario_filter = (
+        models.CalcScenario.flowsheet_version_id.in_(_linked_version_ids(project.id)),
+        models.CalcScenario.project_id == project.id,
     )
-    calc_runs_by_status = {status: count for status, count in status_rows if status is not None}
+    comment_filter = (models.Comment.project_id == project.id,)
 
-    scenario_ids = [
-        row[0]
-        for row in db.query(models.CalcScenario.id)
-        .filter(
-            models.CalcScenario.flowsheet_version_id.in_(flowsheet_version_ids),
-            models.CalcScenario.project_id == project.id,
+    # Single round-trip: run aggregates are computed in one pass over calc_run
+    # (FILTER aggregates over the bounded CalcRunStatus domain), scenario and
+    # comment aggregates ride along as scalar subqueries.
+    summary_row = (
+        db.query(
+            func.count(models.CalcRun.id),
+            *[
+                func.count(models.CalcRun.id).filter(models.CalcRun.status == run_status.value)
+                for run_status in CalcRunStatus
+            ],
+            func.max(models.CalcRun.started_at),
+            select(func.count(models.CalcScenario.id)).where(*scenario_filter).scalar_subquery(),
+            select(func.max(models.CalcScenario.created_at))
+            .where(*scenario_filter)
+            .scalar_subquery(),
+            select(func.count(models.Comment.id)).where(*comment_filter).scalar_subquery(),
+            select(func.max(models.Comment.created_at)).where(*comment_filter).scalar_subquery(),
         )
-        .all()
-    ]
-    run_ids = [
-        row[0]
-        for row in db.query(models.CalcRun.id)
         .filter(
-            models.CalcRun.flowsheet_version_id.in_(flowsheet_version_ids),
+            models.CalcRun.flowsheet_version_id.in_(_linked_version_ids(project.id)),
             models.CalcRun.project_id == project.id,
         )
-        .all()
-    ]
-
-    scenario_last = (
-        db.query(func.max(models.CalcScenario.created_at))
-        .filter(models.CalcScenario.id.in_(scenario_ids))
-        .scalar()
-        if scenario_ids
-        else None
-    )
-    run_last = (
-        db.query(func.max(models.CalcRun.started_at))
-        .filter(models.CalcRun.id.in_(run_ids))
-        .scalar()
-        if run_ids
-        else None
-    )
-
-    comments_total = (
-        db.query(func.count(models.Comment.id))
-        .filter(models.Comment.project_id == project.id)
-        .scalar()
-        or 0
-    )
-    comment_last = (
-        db.query(func.max(models.Comment.created_at))
-        .filter(models.Comment.project_id == project.id)
-        .scalar()
+        .one()
     )
+    (
+        calc_runs_total,
+        *status_counts,
+        run_last,
+        scenarios_total,
+        scenario_last,
+        comments_total,
+        comment_last,
+    ) = summary_row
+    calc_runs_by_status = {
+        run_status.value: count for run_status, count in zip(CalcRunStatus, status_counts) if count
+    }
 
     last_candidates = [dt for dt in (scenario_last, run_last, comment_last) if dt is not None]
     last_activity_at = max(last_candidates) if last_candidates else None
@@ -616,10 +624,10 @@ def _calculate_project_summary(
     return ProjectSummary(
         project=ProjectRead.model_validate(project, from_attributes=True),
         flowsheet_versions_total=len(flowsheet_version_ids),
-        scenarios_total=scenarios_total,
-        calc_runs_total=calc_runs_total,
+        scenarios_total=scenarios_total or 0,
+        calc_runs_total=calc_runs_total or 0,
         calc_runs_by_status=calc_runs_by_status,
-        comments_total=comments_total,
+        comments_total=comments_total or 0,
         last_activity_at=last_activity_at,
     )
 
@@ -631,13 +639,19 @@ def get_project_summary(
     current_user: models.User = Depends(get_current_user),
 ) -> ProjectSummary:
     project = _ensure_project_exists_and_get(db, project_id)
-    links = (
-        db.query(models.ProjectFlowsheetVersion)
-        .filter(models.ProjectFlowsheetVersion.project_id == project.id)
-        .all()
-    )
-    flowsheet_version_ids = [link.flowsheet_version_id for link in links]
-    return _calculate_project_summary(db, project, flowsheet_version_ids, current_user)
+    _check_project_read_access(db, project, current_user)
+
+    namespace = project_namespace(project.id)
+    cached = response_cache.get(namespace, "summary")
+    if cached is not None:
+        return cached
+    generation = response_cache.generation(namespace)
+
+    # Only the ids are needed: a Core select skips ORM hydration of the link rows.
+    flowsheet_version_ids = db.execute(_linked_version_ids(project.id)).scalars().all()
+    summary = _calculate_project_summary(db, project, flowsheet_version_ids)
+    response_cache.set(namespace, "summary", summary, generation)
+    return summary
 
 
 @router.get("/{project_id}/members", response_model=list[ProjectMemberRead])
@@ -649,10 +663,11 @@ def list_project_members(
     project = _ensure_project_exists_and_get(db, project_id)
     _check_project_read_access(db, project, current_user)
 
-    # Use joinedload to avoid N+1 when accessing m.user
+    # Use joinedload to avoid N+1 when accessing m.user; user_id is part of the
+    # primary key, so an INNER JOIN is safe and cheaper than the default OUTER JOIN.
     memberships = (
         db.query(models.ProjectMember)
-        .options(joinedload(models.ProjectMember.user))
+        .options(joinedload(models.ProjectMember.user, innerjoin=True), raiseload("*"))
         .filter(models.ProjectMember.project_id == project.id)
         .all()
     )
@@ -681,19 +696,25 @@ def add_project_member(
     if project.owner_user_id != current_user.id:
         raise_permission_denied(action=f"add members to project '{project.name}'")
 
-    user = db.query(models.User).filter(models.User.email == payload.email).first()
-    if user is None:
+    # One round-trip resolves both the user and any existing membership.
+    row = (
+        db.query(models.User, models.ProjectMember)
+        .outerjoin(
+            models.ProjectMember,
+            and_(
+                models.ProjectMember.user_id == models.User.id,
+                models.ProjectMember.project_id == project.id,
+            ),
+        )
+        .filter(models.User.email == payload.email)
+        .first()
+    )
+    if row is None:
         raise_not_found("User", payload.email, f"User with email '{payload.email}' not found")
+    user, existing = row
     if user.id == project.owner_user_id:
         raise_bad_request(f"User '{payload.email}' is already the project owner")
 
-    existing = (
-        db.query(models.ProjectMember)
-        .filter(
-            models.ProjectMember.project_id == project.id, models.ProjectMember.user_id == user.id
-        )
-        .first()
-    )
     if existing:
         return ProjectMemberRead(
             user=UserRead.model_validate(user, from_attributes=True),
@@ -701,15 +722,19 @@ def add_project_member(
             added_at=existing.added_at,
         )
 
-    membership = models.ProjectMember(project_id=project.id, user_id=user.id, role=payload.role)
-    db.add(membership)
+    # INSERT ... RETURNING hands back the server-side added_at default in the same
+    # statement, so no refresh SELECT is needed after commit.
+    role, added_at = db.execute(
+        insert(models.ProjectMember)
+        .values(project_id=project.id, user_id=user.id, role=payload.role)
+        .returning(models.ProjectMember.role, models.ProjectMember.added_at)
+    ).one()
     db.commit()
-    db.refresh(membership)
 
     return ProjectMemberRead(
         user=UserRead.model_validate(user, from_attributes=True),
-        role=membership.role,
-        added_at=membership.added_at,
+        role=role,
+        added_at=added_at,
     )
 
 
@@ -755,42 +780,54 @@ def get_project_dashboard(
         raise_permission_denied(
             action=f"view dashboard for project '{project.name}' (login required)"
         )
+    _check_project_read_access(db, project, current_user)
 
-    # Get project flowsheet version links with joinedload to avoid N+1
-    links = (
-        db.query(models.ProjectFlowsheetVersion)
-        .options(joinedload(models.ProjectFlowsheetVersion.flowsheet_version))
-        .filter(models.ProjectFlowsheetVersion.project_id == project.id)
+    # The payload does not depend on the caller once access is granted.
+    namespace = project_namespace(project.id)
+    cache_key = ("dashboard", runs_limit)
+    cached = response_cache.get(namespace, cache_key)
+    if cached is not None:
+        return cached
+    generation = response_cache.generation(namespace)
+
+    # Load the linked versions themselves; the link rows carry nothing the payload needs.
+    flowsheet_versions = (
+        db.query(models.FlowsheetVersion)
+        .options(raiseload("*"))
+        .filter(models.FlowsheetVersion.id.in_(_linked_version_ids(project.id)))
         .all()
     )
-    flowsheet_version_ids = [link.flowsheet_version_id for link in links]
-    summary = _calculate_project_summary(db, project, flowsheet_version_ids, current_user)
-    _check_project_read_access(db, project, current_user)
+    flowsheet_version_ids = [version.id for version in flowsheet_versions]
+    summary = _calculate_project_summary(db, project, flowsheet_version_ids)
 
-    # Get flowsheet versions from already-loaded links (no additional query needed)
-    flowsheet_versions_dto = [
-        FlowsheetVersionRead.model_validate(link.flowsheet_version, from_attributes=True)
-        for link in links
-    ]
+    flowsheet_versions_dto = _FLOWSHEET_VERSION_LIST_ADAPTER.validate_python(
+        flowsheet_versions, from_attributes=True
+    )
 
-    if flowsheet_version_ids:
+    # The summary's counts double as existence probes: skip list queries that
+    # are known to come back empty (e.g. freshly created projects).
+    if summary.scenarios_total:
         scenarios = (
             db.query(models.CalcScenario)
+            .options(raiseload("*"))
             .filter(
-                models.CalcScenario.flowsheet_version_id.in_(flowsheet_version_ids),
+                models.CalcScenario.flowsheet_version_id.in_(_linked_version_ids(project.id)),
                 models.CalcScenario.project_id == project.id,
             )
             .all()
         )
     else:
         scenarios = []
-    scenarios_dto = [CalcScenarioRead.model_validate(s, from_attributes=True) for s in scenarios]
+    scenarios_dto = [CalcScenarioRead.from_orm_trusted(scenario) for scenario in scenarios]
 
-    if flowsheet_version_ids:
+    if summary.calc_runs_total:
         recent_runs = (
             db.query(models.CalcRun)
+            # CalcRunListItem only needs started_by_user_id: raiseload("*") also skips
+            # the model's default eager JOIN to user.
+            .options(raiseload("*"))
             .filter(
-                models.CalcRun.flowsheet_version_id.in_(flowsheet_version_ids),
+                models.CalcRun.flowsheet_version_id.in_(_linked_version_ids(project.id)),
                 models.CalcRun.project_id == project.id,
             )
             .order_by(models.CalcRun.started_at.desc().nullslast())
@@ -799,20 +836,19 @@ def get_project_dashboard(
         )
     else:
         recent_runs = []
-    recent_runs_dto = [CalcRunListItem.model_validate(r, from_attributes=True) for r in recent_runs]
+    recent_runs_dto = [CalcRunListItem.from_orm_trusted(run) for run in recent_runs]
 
     recent_comments = (
         db.query(models.Comment)
+        .options(raiseload("*"))
         .filter(models.Comment.project_id == project.id)
         .order_by(models.Comment.created_at.desc(), models.Comment.id.desc())
         .limit(RECENT_COMMENTS_LIMIT)
         .all()
     )
-    recent_comments_dto = [
-        CommentRead.model_validate(c, from_attributes=True) for c in recent_comments
-    ]
+    recent_comments_dto = [CommentRead.from_orm_trusted(comment) for comment in recent_comments]
 
-    return ProjectDashboardResponse(
+    dashboard = ProjectDashboardResponse(
         project=ProjectRead.model_validate(project, from_attributes=True),
         summary=summary,
         flowsheet_versions=flowsheet_versions_dto,
@@ -820,3 +856,5 @@ def get_project_dashboard(
         recent_calc_runs=recent_runs_dto,
         recent_comments=recent_comments_dto,
     )
+    response_cache.set(namespace, cache_key, dashboard, generation)
+    return dashboard
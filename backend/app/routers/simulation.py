@@ -66,6 +66,16 @@ class SimulationResponse(BaseModel):
     execution_time_ms: float = 0.0
 
 
+def _build_graph(request: SimulationRequest) -> FlowsheetGraph:
+    """Построить граф движка из запроса.
+
+    Узлы и связи сериализуются одним вызовом model_dump (Rust-ядро pydantic)
+    вместо поэлементной пересборки словарей.
+    """
+    payload = request.model_dump(include={"nodes", "edges"})
+    return FlowsheetGraph.from_flowsheet_data(payload["nodes"], payload["edges"])
+
+
 @router.post("/run", response_model=SimulationResponse)
 def run_simulation(request: SimulationRequest) -> SimulationResponse:
     """
@@ -111,30 +121,9 @@ def run_simulation(request: SimulationRequest) -> SimulationResponse:
     if not request.nodes:
         raise HTTPException(status_code=400, detail="No nodes provided")
 
-    # Преобразуем в формат для движка
-    nodes_data = [
-        {
-            "id": n.id,
-            "type": n.type,
-            "data": n.data,
-        }
-        for n in request.nodes
-    ]
-
-    edges_data = [
-        {
-            "id": e.id,
-            "source": e.source,
-            "target": e.target,
-            "sourceHandle": e.sourceHandle,
-            "targetHandle": e.targetHandle,
-        }
-        for e in request.edges
-    ]
-
     # Создаём граф и исполнитель
     try:
-        graph = FlowsheetGraph.from_flowsheet_data(nodes_data, edges_data)
+        graph = _build_graph(request)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Invalid flowsheet: {str(e)}")
 
@@ -176,20 +165,8 @@ def validate_flowsheet(request: SimulationRequest) -> dict[str, Any]:
     - Корректность связей
     - Наличие рециклов
     """
-    nodes_data = [{"id": n.id, "type": n.type, "data": n.data} for n in request.nodes]
-    edges_data = [
-        {
-            "id": e.id,
-            "source": e.source,
-            "target": e.target,
-            "sourceHandle": e.sourceHandle,
-            "targetHandle": e.targetHandle,
-        }
-        for e in request.edges
-    ]
-
     try:
-        graph = FlowsheetGraph.from_flowsheet_data(nodes_data, edges_data)
+        graph = _build_graph(request)
     except Exception as e:
         return {
             "valid": False,
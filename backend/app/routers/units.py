@@ -4,22 +4,39 @@ from app import models
 from app.core.exceptions import raise_not_found
 from app.db import get_db
 from app.schemas import PaginatedResponse, UnitCreate, UnitRead, UnitUpdate
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.orm import Session
 
 router = APIRouter()
 
 
 @router.get("/", response_model=PaginatedResponse[UnitRead])
-def list_units(skip: int = 0, limit: int = 50, db: Session = Depends(get_db)):
+def list_units(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=100),
+    cursor: uuid.UUID | None = Query(
+        default=None,
+        description="Keyset cursor: id of the last unit of the previous page (overrides skip)",
+    ),
+    db: Session = Depends(get_db),
+):
     query = db.query(models.Unit)
     total = query.count()
-    items = query.offset(skip).limit(limit).all()
+    query = query.order_by(models.Unit.id)
+    if cursor is not None:
+        # Keyset pagination: seek by primary key instead of scanning and skipping.
+        query = query.filter(models.Unit.id > cursor)
+    else:
+        query = query.offset(skip)
+    # Fetch one extra row to know whether another page exists.
+    items = query.limit(limit + 1).all()
+    next_cursor = str(items[limit - 1].id) if len(items) > limit else None
     return PaginatedResponse(
-        items=items,
+        items=items[:limit],
         total=total,
         skip=skip,
         limit=limit,
+        next_cursor=next_cursor,
     )
 
 
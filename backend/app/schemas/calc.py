@@ -10,6 +10,8 @@ class UnitCalcInput(BaseModel):
     ore_hardness: float
     target_p80_um: Optional[float] = None
 
+    model_config = {"defer_build": True}
+
 
 class FlowsheetCalcRequest(BaseModel):
     flowsheet_version_id: UUID
@@ -18,6 +20,8 @@ class FlowsheetCalcRequest(BaseModel):
     comment: Optional[str] = None
     units: List[UnitCalcInput]
 
+    model_config = {"defer_build": True}
+
 
 class UnitCalcResult(BaseModel):
     unit_id: UUID
@@ -25,9 +29,13 @@ class UnitCalcResult(BaseModel):
     specific_energy_kwh_per_t: float
     p80_um: float
 
+    model_config = {"defer_build": True}
+
 
 class FlowsheetCalcResult(BaseModel):
     flowsheet_version_id: UUID
     total_throughput_tph: float
     total_energy_kwh_per_t: float
     units: List[UnitCalcResult]
+
+    model_config = {"defer_build": True}
@@ -11,6 +11,8 @@ class CalcComparisonBase(BaseModel):
     description: Optional[str] = None
     run_ids: list[uuid.UUID]
 
+    model_config = {"defer_build": True}
+
 
 class CalcComparisonCreate(CalcComparisonBase):
     flowsheet_version_id: uuid.UUID
@@ -22,7 +24,7 @@ class CalcComparisonRead(CalcComparisonBase):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "defer_build": True}
 
 
 class CalcComparisonListItem(BaseModel):
@@ -31,14 +33,18 @@ class CalcComparisonListItem(BaseModel):
     name: str
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "defer_build": True}
 
 
 class CalcComparisonListResponse(BaseModel):
     items: list[CalcComparisonListItem]
     total: int
 
+    model_config = {"defer_build": True}
+
 
 class CalcComparisonDetailResponse(BaseModel):
     comparison: CalcComparisonRead
     runs: CalcRunCompareResponse
+
+    model_config = {"defer_build": True}
@@ -9,6 +9,8 @@ class PSDPoint(BaseModel):
     size_um: float
     pass_pct: float
 
+    model_config = {"defer_build": True}
+
 
 class FactPSD(BaseModel):
     """Measured/fact PSD data for comparison with model."""
@@ -17,6 +19,8 @@ class FactPSD(BaseModel):
     p80_um: Optional[float] = None
     p50_um: Optional[float] = None
 
+    model_config = {"defer_build": True}
+
 
 class CalcInput(BaseModel):
     feed_tph: Optional[float] = None
@@ -26,6 +30,8 @@ class CalcInput(BaseModel):
     water_fraction: Optional[float] = None
     fact_psd: Optional[FactPSD] = None  # Measured PSD for fact vs model comparison
 
+    model_config = {"defer_build": True}
+
 
 class CalcResultSummary(BaseModel):
     throughput_tph: Optional[float] = None
@@ -40,4 +46,4 @@ class CalcResultSummary(BaseModel):
     warnings: Optional[list[str]] = None
     errors: Optional[list[str]] = None
 
-    model_config = {"extra": "allow"}  # Allow additional fields
+    model_config = {"extra": "allow", "defer_build": True}  # Allow additional fields
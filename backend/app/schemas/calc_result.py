@@ -16,6 +16,8 @@ class CalcResultStream(BaseModel):
     p80_um: Optional[float] = None
     p50_um: Optional[float] = None
 
+    model_config = {"defer_build": True}
+
 
 class CalcResultUnit(BaseModel):
     id: str
@@ -27,6 +29,8 @@ class CalcResultUnit(BaseModel):
     specific_energy_kwh_t: Optional[float] = None
     power_kw: Optional[float] = None
 
+    model_config = {"defer_build": True}
+
 
 class CalcResultKPI(BaseModel):
     total_feed_tph: Optional[float] = None
@@ -37,6 +41,8 @@ class CalcResultKPI(BaseModel):
     total_power_kw: Optional[float] = None
     specific_energy_kwh_t: Optional[float] = None
 
+    model_config = {"defer_build": True}
+
 
 class CalcResult(CalcResultSummary):
     """
@@ -50,4 +56,4 @@ class CalcResult(CalcResultSummary):
     units: List[CalcResultUnit] = Field(default_factory=list)
     kpi: CalcResultKPI
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "defer_build": True}
@@ -1,9 +1,10 @@
 from datetime import datetime
-from typing import Optional
+from typing import Any, ClassVar, Iterable, Optional
 from uuid import UUID
 
 from app.schemas.calc_io import CalcInput, CalcResultSummary
-from pydantic import BaseModel
+from app.schemas.trusted import TrustedOrmModel
+from pydantic import BaseModel, TypeAdapter
 
 
 class CalcRunCreate(BaseModel):
@@ -15,8 +16,19 @@ class CalcRunCreate(BaseModel):
     input_json: Optional[CalcInput] = None
     started_by_user_id: Optional[UUID] = None
 
+    model_config = {"defer_build": True}
 
-class CalcRunRead(BaseModel):
+
+class _TrustedCalcRunModel(TrustedOrmModel):
+    """Base for calc run read models built from CalcRun rows."""
+
+    _json_models: ClassVar[dict[str, type[BaseModel]]] = {
+        "input_json": CalcInput,
+        "result_json": CalcResultSummary,
+    }
+
+
+class CalcRunRead(_TrustedCalcRunModel):
     id: UUID
     flowsheet_version_id: UUID
     scenario_id: Optional[UUID] = None
@@ -36,7 +48,7 @@ class CalcRunRead(BaseModel):
     model_config = {"from_attributes": True}
 
 
-class CalcRunListItem(BaseModel):
+class CalcRunListItem(_TrustedCalcRunModel):
     id: UUID
     flowsheet_version_id: UUID
     scenario_id: Optional[UUID] = None
@@ -58,6 +70,8 @@ class CalcRunListResponse(BaseModel):
     items: list[CalcRunListItem]
     total: int
 
+    model_config = {"defer_build": True}
+
 
 class CalcRunComparisonItem(BaseModel):
     id: UUID
@@ -68,11 +82,36 @@ class CalcRunComparisonItem(BaseModel):
     input: CalcInput
     result: Optional[CalcResultSummary] = None
 
+    model_config = {"defer_build": True}
+
+
+_COMPARISON_ITEMS_ADAPTER = TypeAdapter(list[CalcRunComparisonItem])
+
+
+def comparison_items_from_runs(runs: Iterable[Any]) -> list[CalcRunComparisonItem]:
+    """Validate CalcRun rows into comparison items with a single pydantic-core call."""
+    return _COMPARISON_ITEMS_ADAPTER.validate_python(
+        [
+            {
+                "id": run.id,
+                "scenario_id": run.scenario_id,
+                "status": run.status,
+                "started_at": run.started_at,
+                "finished_at": run.finished_at,
+                "input": run.input_json,
+                "result": run.result_json,
+            }
+            for run in runs
+        ]
+    )
+
 
 class CalcRunCompareResponse(BaseModel):
     items: list[CalcRunComparisonItem]
     total: int
 
+    model_config = {"defer_build": True}
+
 
 class CalcRunDelta(BaseModel):
     throughput_delta_abs: Optional[float] = None
@@ -82,17 +121,23 @@ class CalcRunDelta(BaseModel):
     p80_out_delta_abs: Optional[float] = None
     p80_out_delta_pct: Optional[float] = None
 
+    model_config = {"defer_build": True}
+
 
 class CalcRunCompareWithBaselineItem(BaseModel):
     run: CalcRunComparisonItem
     deltas: CalcRunDelta
 
+    model_config = {"defer_build": True}
+
 
 class CalcRunCompareWithBaselineResponse(BaseModel):
     baseline: CalcRunComparisonItem
     items: list[CalcRunCompareWithBaselineItem]
     total: int
 
+    model_config = {"defer_build": True}
+
 
 class BatchRunRequest(BaseModel):
     """Request to run multiple scenarios"""
@@ -102,9 +147,13 @@ class BatchRunRequest(BaseModel):
     project_id: Optional[int] = None
     comment: Optional[str] = None
 
+    model_config = {"defer_build": True}
+
 
 class BatchRunResponse(BaseModel):
     """Response containing multiple created runs"""
 
     runs: list[CalcRunRead]
     total: int
+
+    model_config = {"defer_build": True}
@@ -1,8 +1,9 @@
 from datetime import datetime
-from typing import Optional
+from typing import ClassVar, Optional
 from uuid import UUID
 
 from app.schemas.calc_io import CalcInput
+from app.schemas.trusted import TrustedOrmModel
 from pydantic import BaseModel
 
 
@@ -14,6 +15,8 @@ class CalcScenarioBase(BaseModel):
     is_recommended: bool = False
     recommendation_note: Optional[str] = None
 
+    model_config = {"defer_build": True}
+
 
 class CalcScenarioCreate(CalcScenarioBase):
     flowsheet_version_id: UUID
@@ -28,8 +31,10 @@ class CalcScenarioUpdate(BaseModel):
     is_recommended: Optional[bool] = None
     recommendation_note: Optional[str] = None
 
+    model_config = {"defer_build": True}
+
 
-class CalcScenarioRead(CalcScenarioBase):
+class CalcScenarioRead(CalcScenarioBase, TrustedOrmModel):
     id: UUID
     flowsheet_version_id: UUID
     project_id: int
@@ -37,10 +42,12 @@ class CalcScenarioRead(CalcScenarioBase):
     created_at: datetime
     updated_at: datetime
 
+    _json_models: ClassVar[dict[str, type[BaseModel]]] = {"default_input_json": CalcInput}
+
     model_config = {"from_attributes": True}
 
 
-class CalcScenarioListItem(BaseModel):
+class CalcScenarioListItem(TrustedOrmModel):
     id: UUID
     name: str
     flowsheet_version_id: UUID
@@ -56,3 +63,5 @@ class CalcScenarioListItem(BaseModel):
 class CalcScenarioListResponse(BaseModel):
     items: list[CalcScenarioListItem]
     total: int
+
+    model_config = {"defer_build": True}
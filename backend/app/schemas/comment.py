@@ -1,29 +1,23 @@
 import uuid
 from datetime import datetime
-from typing import Literal, Optional
+from typing import Annotated, Literal, Optional
 
-from pydantic import BaseModel, computed_field, field_validator, model_validator
+from app.schemas.trusted import TrustedOrmModel
+from pydantic import BaseModel, StringConstraints, computed_field, model_validator
 
-
-def _validate_text(value: str) -> str:
-    trimmed = value.strip()
-    if len(trimmed) < 1:
-        raise ValueError("text must not be empty")
-    if len(trimmed) > 2000:
-        raise ValueError("text must be at most 2000 characters long")
-    return trimmed
+# Trimmed and length-checked inside pydantic-core, without a Python validator callback.
+CommentText = Annotated[
+    str, StringConstraints(strip_whitespace=True, min_length=1, max_length=2000)
+]
 
 
 class CommentBase(BaseModel):
     scenario_id: Optional[uuid.UUID] = None
     calc_run_id: Optional[uuid.UUID] = None
     author: Optional[str] = None
-    text: str
+    text: CommentText
 
-    @field_validator("text")
-    @classmethod
-    def _normalize_text(cls, value: str) -> str:
-        return _validate_text(value)
+    model_config = {"defer_build": True}
 
 
 class CommentCreate(CommentBase):
@@ -36,7 +30,7 @@ class CommentCreate(CommentBase):
         return self
 
 
-class CommentRead(CommentBase):
+class CommentRead(CommentBase, TrustedOrmModel):
     id: uuid.UUID
     project_id: int
     created_at: datetime
@@ -53,11 +47,10 @@ class CommentListResponse(BaseModel):
     items: list[CommentRead]
     total: int
 
+    model_config = {"defer_build": True}
+
 
 class UserCommentCreate(BaseModel):
-    text: str
+    text: CommentText
 
-    @field_validator("text")
-    @classmethod
-    def _normalize_text(cls, value: str) -> str:
-        return _validate_text(value)
+    model_config = {"defer_build": True}
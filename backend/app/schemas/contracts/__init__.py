@@ -4,147 +4,185 @@
 # F3.2 — Material Validation (валидация, паспорт)
 # Версионируемые JSON-схемы для обмена данными между модулями
 
-from .blast import Blast, BlastBlock, BlastSource, BlastStatus, GeoLocation
-from .import_parsers import (
-    TYLER_MESH_TO_MM,
-    ImportFormat,
-    ImportMetadata,
-    ImportResult,
-    MultiImportResult,
-    import_psd,
-    parse_csv_multi,
-    parse_csv_retained,
-    parse_csv_simple,
-    parse_csv_tyler,
-    parse_json_material,
-    parse_json_psd,
-    tyler_mesh_to_mm,
-)
-from .kpi import (
-    KPI,
-    KPICollection,
-    KPIStatus,
-    KPIType,
-    circulating_load_kpi,
-    mill_utilization_kpi,
-    p80_kpi,
-    specific_energy_kpi,
-    throughput_kpi,
-)
-from .material import Material, MaterialComponent, MaterialPhase, MaterialQuality
-from .material_validation import (
-    CompletenessLevel,
-    MaterialPassport,
-    MaterialValidator,
-    PSDMetrics,
-    PSDQuality,
-    ValidationCategory,
-    ValidationIssue,
-    ValidationResult,
-    ValidationSeverity,
-    compute_psd_metrics,
-    generate_passport,
-    get_material_passport,
-    is_material_valid,
-    validate_material,
-)
-from .psd import PSD, PSDInterpolation, PSDPoint, PSDQuantiles, PSDStats
-from .psd_ops import (
-    FLOTATION_FINE_SERIES,
-    GRINDING_COARSE_SERIES,
-    ISO_R20_SERIES,
-    SIEVE_SERIES_REGISTRY,
-    TYLER_SERIES,
-    SieveSeries,
-    SieveStandard,
-    blend_psds,
-    compute_psd_stats,
-    compute_retained,
-    create_custom_series,
-    get_sieve_series,
-    psd_to_histogram,
-    rebin_psd,
-    scale_psd,
-    truncate_psd,
-)
-from .stream import Stream, StreamPort, StreamType
+import importlib
+from typing import TYPE_CHECKING, Any
 
-__all__ = [
+if TYPE_CHECKING:
+    from .blast import Blast, BlastBlock, BlastSource, BlastStatus, GeoLocation
+    from .import_parsers import (
+        TYLER_MESH_TO_MM,
+        ImportFormat,
+        ImportMetadata,
+        ImportResult,
+        MultiImportResult,
+        import_psd,
+        parse_csv_multi,
+        parse_csv_retained,
+        parse_csv_simple,
+        parse_csv_tyler,
+        parse_json_material,
+        parse_json_psd,
+        tyler_mesh_to_mm,
+    )
+    from .kpi import (
+        KPI,
+        KPICollection,
+        KPIStatus,
+        KPIType,
+        circulating_load_kpi,
+        mill_utilization_kpi,
+        p80_kpi,
+        specific_energy_kpi,
+        throughput_kpi,
+    )
+    from .material import Material, MaterialComponent, MaterialPhase, MaterialQuality
+    from .material_validation import (
+        CompletenessLevel,
+        MaterialPassport,
+        MaterialValidator,
+        PSDMetrics,
+        PSDQuality,
+        ValidationCategory,
+        ValidationIssue,
+        ValidationResult,
+        ValidationSeverity,
+        compute_psd_metrics,
+        generate_passport,
+        get_material_passport,
+        is_material_valid,
+        validate_material,
+    )
+    from .psd import PSD, PSDInterpolation, PSDPoint, PSDQuantiles, PSDStats
+    from .psd_ops import (
+        FLOTATION_FINE_SERIES,
+        GRINDING_COARSE_SERIES,
+        ISO_R20_SERIES,
+        SIEVE_SERIES_REGISTRY,
+        TYLER_SERIES,
+        SieveSeries,
+        SieveStandard,
+        blend_psds,
+        compute_psd_stats,
+        compute_retained,
+        create_custom_series,
+        get_sieve_series,
+        psd_to_histogram,
+        rebin_psd,
+        scale_psd,
+        truncate_psd,
+    )
+    from .stream import Stream, StreamPort, StreamType
+
+# Submodules are imported on first attribute access (PEP 562): app startup only
+# pulls in the parsers used by the materials router, not blast/KPI/validation.
+_EXPORTS: dict[str, tuple[str, ...]] = {
     # PSD
-    "PSD",
-    "PSDPoint",
-    "PSDQuantiles",
-    "PSDStats",
-    "PSDInterpolation",
+    "psd": (
+        "PSD",
+        "PSDPoint",
+        "PSDQuantiles",
+        "PSDStats",
+        "PSDInterpolation",
+    ),
     # PSD Operations (F3.3)
-    "SieveStandard",
-    "SieveSeries",
-    "TYLER_SERIES",
-    "ISO_R20_SERIES",
-    "GRINDING_COARSE_SERIES",
-    "FLOTATION_FINE_SERIES",
-    "SIEVE_SERIES_REGISTRY",
-    "get_sieve_series",
-    "create_custom_series",
-    "rebin_psd",
-    "blend_psds",
-    "compute_psd_stats",
-    "compute_retained",
-    "psd_to_histogram",
-    "truncate_psd",
-    "scale_psd",
+    "psd_ops": (
+        "SieveStandard",
+        "SieveSeries",
+        "TYLER_SERIES",
+        "ISO_R20_SERIES",
+        "GRINDING_COARSE_SERIES",
+        "FLOTATION_FINE_SERIES",
+        "SIEVE_SERIES_REGISTRY",
+        "get_sieve_series",
+        "create_custom_series",
+        "rebin_psd",
+        "blend_psds",
+        "compute_psd_stats",
+        "compute_retained",
+        "psd_to_histogram",
+        "truncate_psd",
+        "scale_psd",
+    ),
     # Material
-    "Material",
-    "MaterialComponent",
-    "MaterialQuality",
-    "MaterialPhase",
+    "material": (
+        "Material",
+        "MaterialComponent",
+        "MaterialQuality",
+        "MaterialPhase",
+    ),
     # Material Validation (F3.2)
-    "MaterialValidator",
-    "MaterialPassport",
-    "ValidationResult",
-    "ValidationIssue",
-    "ValidationSeverity",
-    "ValidationCategory",
-    "CompletenessLevel",
-    "PSDQuality",
-    "PSDMetrics",
-    "validate_material",
-    "is_material_valid",
-    "generate_passport",
-    "get_material_passport",
-    "compute_psd_metrics",
+    "material_validation": (
+        "MaterialValidator",
+        "MaterialPassport",
+        "ValidationResult",
+        "ValidationIssue",
+        "ValidationSeverity",
+        "ValidationCategory",
+        "CompletenessLevel",
+        "PSDQuality",
+        "PSDMetrics",
+        "validate_material",
+        "is_material_valid",
+        "generate_passport",
+        "get_material_passport",
+        "compute_psd_metrics",
+    ),
     # Stream
-    "Stream",
-    "StreamType",
-    "StreamPort",
+    "stream": (
+        "Stream",
+        "StreamType",
+        "StreamPort",
+    ),
     # KPI
-    "KPI",
-    "KPIType",
-    "KPIStatus",
-    "KPICollection",
-    "throughput_kpi",
-    "specific_energy_kpi",
-    "p80_kpi",
-    "circulating_load_kpi",
-    "mill_utilization_kpi",
+    "kpi": (
+        "KPI",
+        "KPIType",
+        "KPIStatus",
+        "KPICollection",
+        "throughput_kpi",
+        "specific_energy_kpi",
+        "p80_kpi",
+        "circulating_load_kpi",
+        "mill_utilization_kpi",
+    ),
     # Blast
-    "Blast",
-    "BlastBlock",
-    "BlastSource",
-    "BlastStatus",
-    "GeoLocation",
+    "blast": (
+        "Blast",
+        "BlastBlock",
+        "BlastSource",
+        "BlastStatus",
+        "GeoLocation",
+    ),
     # Import Parsers (F3.1)
-    "ImportFormat",
-    "ImportMetadata",
-    "ImportResult",
-    "MultiImportResult",
-    "import_psd",
-    "parse_csv_simple",
-    "parse_csv_retained",
-    "parse_csv_tyler",
-    "parse_csv_multi",
-    "parse_json_psd",
-    "parse_json_material",
-    "tyler_mesh_to_mm",
-    "TYLER_MESH_TO_MM",
-]
+    "import_parsers": (
+        "ImportFormat",
+        "ImportMetadata",
+        "ImportResult",
+        "MultiImportResult",
+        "import_psd",
+        "parse_csv_simple",
+        "parse_csv_retained",
+        "parse_csv_tyler",
+        "parse_csv_multi",
+        "parse_json_psd",
+        "parse_json_material",
+        "tyler_mesh_to_mm",
+        "TYLER_MESH_TO_MM",
+    ),
+}
+_LAZY = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
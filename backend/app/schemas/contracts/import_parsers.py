@@ -17,8 +17,9 @@ import csv
 import json
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 from .psd import PSD, PSDInterpolation, PSDPoint
 
@@ -38,7 +39,7 @@ class ImportFormat(str, Enum):
     EXCEL = "excel"  # Excel файл (TODO)
 
 
-@dataclass
+@dataclass(slots=True)
 class ImportMetadata:
     """Метаданные, извлечённые из файла."""
 
@@ -53,7 +54,7 @@ class ImportMetadata:
     extra: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ImportResult:
     """Результат импорта."""
 
@@ -65,7 +66,7 @@ class ImportResult:
     format_detected: Optional[ImportFormat] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MultiImportResult:
     """Результат импорта нескольких материалов."""
 
@@ -111,6 +112,35 @@ TYLER_MESH_TO_MM: Dict[int, float] = {
 }
 
 
+# Таблицы замены для нормализации ключей метаданных и имён колонок
+_META_KEY_TABLE = str.maketrans({" ": "_"})
+_COLUMN_NAME_TABLE = str.maketrans({" ": "_", "-": "_"})
+
+
+def _parse_pct(value: str) -> float:
+    return float(value.replace("%", ""))
+
+
+def _parse_leading_float(value: str) -> float:
+    return float(value.split()[0])
+
+
+# Ключ метаданных → (атрибут ImportMetadata, конвертер, имя для предупреждения)
+_META_FIELDS: Dict[str, Tuple[str, Callable[[str], Any], str]] = {
+    "material": ("name", str, "name"),
+    "name": ("name", str, "name"),
+    "source": ("source", str, "source"),
+    "sample_id": ("sample_id", str, "sample id"),
+    "date": ("sample_date", str, "date"),
+    "specific_gravity": ("specific_gravity", float, "specific gravity"),
+    "sg": ("specific_gravity", float, "specific gravity"),
+    "moisture": ("moisture_pct", _parse_pct, "moisture"),
+    "bond_work_index": ("bond_wi", _parse_leading_float, "Bond WI"),
+    "bond_wi": ("bond_wi", _parse_leading_float, "Bond WI"),
+    "abrasion_index": ("abrasion_index", float, "abrasion index"),
+}
+
+
 def tyler_mesh_to_mm(mesh: int) -> Optional[float]:
     """Конвертирует Tyler mesh в мм."""
     return TYLER_MESH_TO_MM.get(mesh)
@@ -133,12 +163,80 @@ def parse_metadata_line(line: str) -> Tuple[Optional[str], Optional[str]]:
         return None, None
 
     key, value = line.split(":", 1)
-    return key.strip().lower().replace(" ", "_"), value.strip()
+    return key.strip().lower().translate(_META_KEY_TABLE), value.strip()
 
 
+@lru_cache(maxsize=1024)
 def normalize_column_name(name: str) -> str:
     """Нормализует имя колонки."""
-    return name.strip().lower().replace(" ", "_").replace("-", "_")
+    return name.strip().lower().translate(_COLUMN_NAME_TABLE)
+
+
+def _split_csv_lines(content: str) -> Tuple[List[str], List[str]]:
+    """
+    Делит содержимое CSV за один проход на строки метаданных ('#...') и данных.
+
+    Пустые строки отбрасываются.
+    """
+    meta_lines: List[str] = []
+    data_lines: List[str] = []
+    for line in content.splitlines():
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if stripped[0] == "#":
+            meta_lines.append(line)
+        else:
+            data_lines.append(line)
+    return meta_lines, data_lines
+
+
+def _scan_csv_header(content: str) -> Tuple[bool, Optional[str]]:
+    """
+    Находит первую строку данных (заголовок), не разбивая весь файл на строки.
+
+    Returns:
+        (были ли строки метаданных до заголовка, заголовок или None)
+    """
+    has_meta = False
+    pos = 0
+    size = len(content)
+    while pos < size:
+        end = content.find("\n", pos)
+        if end == -1:
+            end = size
+        line = content[pos:end].strip()
+        pos = end + 1
+        if not line:
+            continue
+        if line[0] != "#":
+            return has_meta, line
+        has_meta = True
+    return has_meta, None
+
+
+def _read_csv_header(
+    data_lines: List[str],
+) -> Tuple[Optional[Dict[str, int]], Iterator[List[str]]]:
+    """
+    Читает заголовок CSV и возвращает индексы колонок по нормализованному имени.
+
+    Строки данных отдаются списками ячеек: в отличие от csv.DictReader,
+    на каждую строку не создаётся dict.
+    """
+    rows = csv.reader(data_lines)
+    header = next(rows, None)
+    if header is None:
+        return None, rows
+    return {normalize_column_name(f): i for i, f in enumerate(header)}, rows
+
+
+def _first_column(columns: Dict[str, int], *names: str) -> Optional[int]:
+    """Индекс первой найденной колонки из ``names``."""
+    for name in names:
+        if name in columns:
+            return columns[name]
+    return None
 
 
 def detect_csv_format(
@@ -190,50 +288,22 @@ def parse_csv_simple(
     metadata = ImportMetadata()
 
     # Разделяем на строки метаданных и данных
-    lines = content.strip().split("\n")
-    data_lines = []
-    meta_lines = []
-
-    for line in lines:
-        if line.strip().startswith("#"):
-            meta_lines.append(line)
-        elif line.strip():
-            data_lines.append(line)
+    meta_lines, data_lines = _split_csv_lines(content)
 
     # Парсим метаданные
     for line in meta_lines:
         key, value = parse_metadata_line(line)
-        if key and value:
-            if key == "material" or key == "name":
-                metadata.name = value
-            elif key == "source":
-                metadata.source = value
-            elif key == "sample_id":
-                metadata.sample_id = value
-            elif key == "date":
-                metadata.sample_date = value
-            elif key == "specific_gravity" or key == "sg":
-                try:
-                    metadata.specific_gravity = float(value)
-                except ValueError:
-                    warnings.append(f"Invalid specific gravity: {value}")
-            elif key == "moisture":
-                try:
-                    metadata.moisture_pct = float(value.replace("%", ""))
-                except ValueError:
-                    warnings.append(f"Invalid moisture: {value}")
-            elif key == "bond_work_index" or key == "bond_wi":
-                try:
-                    metadata.bond_wi = float(value.split()[0])
-                except ValueError:
-                    warnings.append(f"Invalid Bond WI: {value}")
-            elif key == "abrasion_index":
-                try:
-                    metadata.abrasion_index = float(value)
-                except ValueError:
-                    warnings.append(f"Invalid abrasion index: {value}")
-            else:
-                metadata.extra[key] = value
+        if not key or not value:
+            continue
+        handler = _META_FIELDS.get(key)
+        if handler is None:
+            metadata.extra[key] = value
+            continue
+        attr, convert, label = handler
+        try:
+            setattr(metadata, attr, convert(value))
+        except ValueError:
+            warnings.append(f"Invalid {label}: {value}")
 
     if not data_lines:
         return ImportResult(
@@ -243,42 +313,39 @@ def parse_csv_simple(
         )
 
     # Парсим CSV
-    reader = csv.DictReader(data_lines)
-
     # Нормализуем имена колонок
-    if reader.fieldnames is None:
+    columns, rows = _read_csv_header(data_lines)
+    if columns is None:
         return ImportResult(
             success=False,
             errors=["No headers found"],
             format_detected=ImportFormat.CSV_SIMPLE,
         )
 
-    field_map = {normalize_column_name(f): f for f in reader.fieldnames}
-
     # Находим нужные колонки
-    size_field = field_map.get(normalize_column_name(size_col))
-    passing_field = field_map.get(normalize_column_name(passing_col))
+    size_idx = columns.get(normalize_column_name(size_col))
+    passing_idx = columns.get(normalize_column_name(passing_col))
 
-    if not size_field:
+    if size_idx is None:
         return ImportResult(
             success=False,
-            errors=[f"Column '{size_col}' not found. Available: {list(field_map.keys())}"],
+            errors=[f"Column '{size_col}' not found. Available: {list(columns.keys())}"],
             format_detected=ImportFormat.CSV_SIMPLE,
         )
 
-    if not passing_field:
+    if passing_idx is None:
         return ImportResult(
             success=False,
-            errors=[f"Column '{passing_col}' not found. Available: {list(field_map.keys())}"],
+            errors=[f"Column '{passing_col}' not found. Available: {list(columns.keys())}"],
             format_detected=ImportFormat.CSV_SIMPLE,
         )
 
     # Парсим точки
     points: List[PSDPoint] = []
-    for i, row in enumerate(reader, start=2):  # Начинаем с 2 (после заголовка)
+    for i, row in enumerate(rows, start=2):  # Начинаем с 2 (после заголовка)
         try:
-            size = float(row[size_field])
-            passing = float(row[passing_field])
+            size = float(row[size_idx])
+            passing = float(row[passing_idx])
 
             # Валидация
             if size <= 0:
@@ -290,7 +357,7 @@ def parse_csv_simple(
 
             points.append(PSDPoint(size_mm=size, cum_passing=passing))
 
-        except (ValueError, KeyError) as e:
+        except (ValueError, IndexError) as e:
             errors.append(f"Row {i}: {e}")
 
     if len(points) < 4:
@@ -301,9 +368,6 @@ def parse_csv_simple(
             format_detected=ImportFormat.CSV_META if meta_lines else ImportFormat.CSV_SIMPLE,
         )
 
-    # Сортируем по размеру
-    points.sort(key=lambda p: p.size_mm)
-
     # Создаём PSD
     try:
         psd = PSD(
@@ -338,8 +402,7 @@ def parse_csv_retained(content: str) -> ImportResult:
     errors: List[str] = []
     warnings: List[str] = []
 
-    lines = content.strip().split("\n")
-    data_lines = [line for line in lines if not line.strip().startswith("#") and line.strip()]
+    _, data_lines = _split_csv_lines(content)
 
     if not data_lines:
         return ImportResult(
@@ -348,29 +411,26 @@ def parse_csv_retained(content: str) -> ImportResult:
             format_detected=ImportFormat.CSV_RETAINED,
         )
 
-    reader = csv.DictReader(data_lines)
-
-    if reader.fieldnames is None:
+    columns, rows = _read_csv_header(data_lines)
+    if columns is None:
         return ImportResult(
             success=False,
             errors=["No headers found"],
             format_detected=ImportFormat.CSV_RETAINED,
         )
 
-    field_map = {normalize_column_name(f): f for f in reader.fieldnames}
+    size_idx = columns.get("size_mm")
+    retained_idx = _first_column(columns, "retained_pct", "retained")
+    cum_retained_idx = _first_column(columns, "cum_retained_pct", "cum_retained")
 
-    size_field = field_map.get("size_mm")
-    retained_field = field_map.get("retained_pct") or field_map.get("retained")
-    cum_retained_field = field_map.get("cum_retained_pct") or field_map.get("cum_retained")
-
-    if not size_field:
+    if size_idx is None:
         return ImportResult(
             success=False,
             errors=["Column 'size_mm' not found"],
             format_detected=ImportFormat.CSV_RETAINED,
         )
 
-    if not retained_field and not cum_retained_field:
+    if retained_idx is None and cum_retained_idx is None:
         return ImportResult(
             success=False,
             errors=["Column 'retained_pct' or 'cum_retained_pct' not found"],
@@ -380,22 +440,24 @@ def parse_csv_retained(content: str) -> ImportResult:
     # Парсим данные
     sizes: List[float] = []
     cum_retained: List[float] = []
+    running = 0.0
 
-    for i, row in enumerate(reader, start=2):
+    for i, row in enumerate(rows, start=2):
         try:
-            size = float(row[size_field])
+            size = float(row[size_idx])
 
-            if cum_retained_field:
-                cr = float(row[cum_retained_field])
+            if cum_retained_idx is not None:
+                cr = float(row[cum_retained_idx])
             else:
                 # Накапливаем retained
-                ret = float(row[retained_field])
-                cr = sum(cum_retained) + ret if cum_retained else ret
+                ret = float(row[retained_idx])
+                running += ret
+                cr = running
 
             sizes.append(size)
             cum_retained.append(cr)
 
-        except (ValueError, KeyError) as e:
+        except (ValueError, IndexError) as e:
             errors.append(f"Row {i}: {e}")
 
     if len(sizes) < 4:
@@ -408,7 +470,6 @@ def parse_csv_retained(content: str) -> ImportResult:
     # Конвертируем cum_retained → cum_passing
     # cum_passing = 100 - cum_retained
     points = [PSDPoint(size_mm=s, cum_passing=100.0 - cr) for s, cr in zip(sizes, cum_retained)]
-    points.sort(key=lambda p: p.size_mm)
 
     try:
         psd = PSD(
@@ -442,8 +503,7 @@ def parse_csv_tyler(content: str) -> ImportResult:
     errors: List[str] = []
     warnings: List[str] = []
 
-    lines = content.strip().split("\n")
-    data_lines = [line for line in lines if not line.strip().startswith("#") and line.strip()]
+    _, data_lines = _split_csv_lines(content)
 
     if not data_lines:
         return ImportResult(
@@ -452,29 +512,26 @@ def parse_csv_tyler(content: str) -> ImportResult:
             format_detected=ImportFormat.CSV_TYLER,
         )
 
-    reader = csv.DictReader(data_lines)
-
-    if reader.fieldnames is None:
+    columns, rows = _read_csv_header(data_lines)
+    if columns is None:
         return ImportResult(
             success=False,
             errors=["No headers found"],
             format_detected=ImportFormat.CSV_TYLER,
         )
 
-    field_map = {normalize_column_name(f): f for f in reader.fieldnames}
+    mesh_idx = columns.get("mesh")
+    passing_idx = _first_column(columns, "cum_passing", "passing")
+    size_idx = columns.get("size_mm")  # Опционально
 
-    mesh_field = field_map.get("mesh")
-    passing_field = field_map.get("cum_passing") or field_map.get("passing")
-    size_field = field_map.get("size_mm")  # Опционально
-
-    if not mesh_field:
+    if mesh_idx is None:
         return ImportResult(
             success=False,
             errors=["Column 'mesh' not found"],
             format_detected=ImportFormat.CSV_TYLER,
         )
 
-    if not passing_field:
+    if passing_idx is None:
         return ImportResult(
             success=False,
             errors=["Column 'cum_passing' not found"],
@@ -482,14 +539,14 @@ def parse_csv_tyler(content: str) -> ImportResult:
         )
 
     points: List[PSDPoint] = []
-    for i, row in enumerate(reader, start=2):
+    for i, row in enumerate(rows, start=2):
         try:
-            mesh = int(row[mesh_field])
-            passing = float(row[passing_field])
+            mesh = int(row[mesh_idx])
+            passing = float(row[passing_idx])
 
             # Получаем размер в мм
-            if size_field and row.get(size_field):
-                size = float(row[size_field])
+            if size_idx is not None and size_idx < len(row) and row[size_idx]:
+                size = float(row[size_idx])
             else:
                 size = tyler_mesh_to_mm(mesh)
                 if size is None:
@@ -498,7 +555,7 @@ def parse_csv_tyler(content: str) -> ImportResult:
 
             points.append(PSDPoint(size_mm=size, cum_passing=passing))
 
-        except (ValueError, KeyError) as e:
+        except (ValueError, IndexError) as e:
             errors.append(f"Row {i}: {e}")
 
     if len(points) < 4:
@@ -508,8 +565,6 @@ def parse_csv_tyler(content: str) -> ImportResult:
             format_detected=ImportFormat.CSV_TYLER,
         )
 
-    points.sort(key=lambda p: p.size_mm)
-
     try:
         psd = PSD(
             points=points,
@@ -542,8 +597,7 @@ def parse_csv_multi(content: str) -> MultiImportResult:
     errors: List[str] = []
     results: List[ImportResult] = []
 
-    lines = content.strip().split("\n")
-    data_lines = [line for line in lines if not line.strip().startswith("#") and line.strip()]
+    _, data_lines = _split_csv_lines(content)
 
     if not data_lines:
         return MultiImportResult(
@@ -551,64 +605,64 @@ def parse_csv_multi(content: str) -> MultiImportResult:
             errors=["No data rows found"],
         )
 
-    reader = csv.DictReader(data_lines)
-
-    if reader.fieldnames is None:
+    columns, rows = _read_csv_header(data_lines)
+    if columns is None:
         return MultiImportResult(
             success=False,
             errors=["No headers found"],
         )
 
-    field_map = {normalize_column_name(f): f for f in reader.fieldnames}
-
-    sample_id_field = field_map.get("sample_id")
-    sample_name_field = field_map.get("sample_name")
-    size_field = field_map.get("size_mm")
-    passing_field = field_map.get("cum_passing")
+    sample_id_idx = columns.get("sample_id")
+    sample_name_idx = columns.get("sample_name")
+    size_idx = columns.get("size_mm")
+    passing_idx = columns.get("cum_passing")
 
-    if not size_field or not passing_field:
+    if size_idx is None or passing_idx is None:
         return MultiImportResult(
             success=False,
             errors=["Required columns 'size_mm' and 'cum_passing' not found"],
         )
 
     # Группируем по sample_id
-    samples: Dict[str, List[Tuple[float, float]]] = {}
+    samples: Dict[str, List[PSDPoint]] = {}
     sample_names: Dict[str, str] = {}
 
-    for i, row in enumerate(reader, start=2):
+    for i, row in enumerate(rows, start=2):
         try:
             sample_id = (
-                row.get(sample_id_field, f"sample_{i}") if sample_id_field else f"sample_{i}"
+                row[sample_id_idx]
+                if sample_id_idx is not None and sample_id_idx < len(row)
+                else f"sample_{i}"
             )
-            sample_name = row.get(sample_name_field, sample_id) if sample_name_field else sample_id
-            size = float(row[size_field])
-            passing = float(row[passing_field])
+            sample_name = (
+                row[sample_name_idx]
+                if sample_name_idx is not None and sample_name_idx < len(row)
+                else sample_id
+            )
+            size = float(row[size_idx])
+            passing = float(row[passing_idx])
 
             if sample_id not in samples:
                 samples[sample_id] = []
                 sample_names[sample_id] = sample_name
 
-            samples[sample_id].append((size, passing))
+            samples[sample_id].append(PSDPoint(size_mm=size, cum_passing=passing))
 
-        except (ValueError, KeyError) as e:
+        except (ValueError, IndexError) as e:
             errors.append(f"Row {i}: {e}")
 
     # Создаём PSD для каждого sample
-    for sample_id, data in samples.items():
-        if len(data) < 4:
+    for sample_id, points in samples.items():
+        if len(points) < 4:
             results.append(
                 ImportResult(
                     success=False,
-                    errors=[f"Sample {sample_id}: need at least 4 points, got {len(data)}"],
+                    errors=[f"Sample {sample_id}: need at least 4 points, got {len(points)}"],
                     format_detected=ImportFormat.CSV_MULTI,
                 )
             )
             continue
 
-        points = [PSDPoint(size_mm=s, cum_passing=p) for s, p in data]
-        points.sort(key=lambda p: p.size_mm)
-
         try:
             psd = PSD(
                 points=points,
@@ -656,9 +710,6 @@ def parse_json_psd(content: str) -> ImportResult:
         "points": [{"size_mm": ..., "cum_passing": ...}, ...]
     }
     """
-    errors: List[str] = []
-    warnings: List[str] = []
-
     try:
         data = json.loads(content)
     except json.JSONDecodeError as e:
@@ -667,6 +718,13 @@ def parse_json_psd(content: str) -> ImportResult:
             errors=[f"Invalid JSON: {e}"],
             format_detected=ImportFormat.JSON_PSD,
         )
+    return _parse_json_psd_from_dict(data)
+
+
+def _parse_json_psd_from_dict(data: Dict[str, Any]) -> ImportResult:
+    """Парсит уже разобранный JSON с PSD данными (см. parse_json_psd)."""
+    errors: List[str] = []
+    warnings: List[str] = []
 
     # Извлекаем points
     points_data = data.get("points", [])
@@ -699,8 +757,6 @@ def parse_json_psd(content: str) -> ImportResult:
             format_detected=ImportFormat.JSON_PSD,
         )
 
-    points.sort(key=lambda p: p.size_mm)
-
     # Определяем интерполяцию
     interp_str = data.get("interpolation", "log_linear")
     try:
@@ -743,9 +799,6 @@ def parse_json_material(content: str) -> ImportResult:
 
     Формат соответствует Material контракту из data_contracts.
     """
-    errors: List[str] = []
-    warnings: List[str] = []
-
     try:
         data = json.loads(content)
     except json.JSONDecodeError as e:
@@ -754,6 +807,13 @@ def parse_json_material(content: str) -> ImportResult:
             errors=[f"Invalid JSON: {e}"],
             format_detected=ImportFormat.JSON_MATERIAL,
         )
+    return _parse_json_material_from_dict(data)
+
+
+def _parse_json_material_from_dict(data: Dict[str, Any]) -> ImportResult:
+    """Парсит уже разобранный Material JSON (см. parse_json_material)."""
+    errors: List[str] = []
+    warnings: List[str] = []
 
     # Извлекаем PSD
     psd_data = data.get("psd")
@@ -765,7 +825,7 @@ def parse_json_material(content: str) -> ImportResult:
         )
 
     # Парсим PSD
-    psd_result = parse_json_psd(json.dumps(psd_data))
+    psd_result = _parse_json_psd_from_dict(psd_data)
     if not psd_result.success:
         return ImportResult(
             success=False,
@@ -824,7 +884,10 @@ def import_psd(
     if isinstance(content, bytes):
         content = content.decode("utf-8")
 
-    content = content.strip()
+    # Без content.strip(): парсеры сами пропускают пробелы и пустые строки,
+    # а копия всего файла ради этого не нужна.
+    # JSON разбирается один раз: при автоопределении формата
+    data: Any = None
 
     # Определяем формат
     if format_hint:
@@ -860,7 +923,8 @@ def import_psd(
             )
     else:
         # Автоопределение по содержимому
-        if content.startswith("{") or content.startswith("["):
+        first_char = next((ch for ch in content if not ch.isspace()), "")
+        if first_char in ("{", "["):
             try:
                 data = json.loads(content)
                 if isinstance(data, dict) and "psd" in data:
@@ -885,9 +949,11 @@ def import_psd(
     elif fmt == ImportFormat.CSV_MULTI:
         return parse_csv_multi(content)
     elif fmt == ImportFormat.JSON_PSD:
-        return parse_json_psd(content)
+        return parse_json_psd(content) if data is None else _parse_json_psd_from_dict(data)
     elif fmt == ImportFormat.JSON_MATERIAL:
-        return parse_json_material(content)
+        if data is None:
+            return parse_json_material(content)
+        return _parse_json_material_from_dict(data)
     else:
         return ImportResult(
             success=False,
@@ -897,16 +963,13 @@ def import_psd(
 
 def _detect_csv_format_from_content(content: str) -> ImportFormat:
     """Определяет формат CSV по содержимому."""
-    lines = content.strip().split("\n")
+    has_meta, header_line = _scan_csv_header(content)
 
-    has_meta = any(line.strip().startswith("#") for line in lines)
-    data_lines = [line for line in lines if not line.strip().startswith("#") and line.strip()]
-
-    if not data_lines:
+    if header_line is None:
         return ImportFormat.CSV_SIMPLE
 
     # Парсим заголовок
-    headers = data_lines[0].split(",")
+    headers = header_line.split(",")
     norm_headers = [normalize_column_name(h) for h in headers]
 
     if "sample_id" in norm_headers or "sample_name" in norm_headers:
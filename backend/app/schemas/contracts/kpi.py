@@ -10,7 +10,8 @@ KPI — Ключевые показатели эффективности.
 from __future__ import annotations
 
 from enum import Enum
-from typing import Dict, List, Optional
+from functools import cached_property
+from typing import Any, ClassVar, Dict, Iterable, List, Mapping, Optional, Tuple
 from uuid import UUID
 
 from pydantic import BaseModel, Field, computed_field
@@ -88,8 +89,12 @@ class KPI(BaseModel):
 
     model_config = {"frozen": True}
 
+    # Производные значения зависят только от полей замороженной модели,
+    # поэтому кэшируются при первом обращении (cached_property).
+    _DERIVED: ClassVar[Tuple[str, ...]] = ("status", "delta_from_baseline", "delta_percent")
+
     @computed_field
-    @property
+    @cached_property
     def status(self) -> KPIStatus:
         """Вычисляет статус относительно целевых значений."""
         if self.target_min is None and self.target_max is None and self.target_value is None:
@@ -110,7 +115,7 @@ class KPI(BaseModel):
         return KPIStatus.OK
 
     @computed_field
-    @property
+    @cached_property
     def delta_from_baseline(self) -> Optional[float]:
         """Абсолютная разница с базовой линией."""
         if self.baseline_value is not None:
@@ -118,13 +123,23 @@ class KPI(BaseModel):
         return None
 
     @computed_field
-    @property
+    @cached_property
     def delta_percent(self) -> Optional[float]:
         """Процентное изменение относительно базовой линии."""
         if self.baseline_value is not None and self.baseline_value != 0:
             return ((self.value - self.baseline_value) / abs(self.baseline_value)) * 100
         return None
 
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> "KPI":
+        """Копия без кэша производных значений, если поля обновлены."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            for name in self._DERIVED:
+                copied.__dict__.pop(name, None)
+        return copied
+
     def with_baseline(self, baseline: float) -> "KPI":
         """Возвращает KPI с установленным baseline."""
         return self.model_copy(update={"baseline_value": baseline})
@@ -193,6 +208,14 @@ class KPICollection(BaseModel):
         """Добавляет KPI (возвращает новую коллекцию)."""
         return self.model_copy(update={"kpis": self.kpis + [kpi]})
 
+    def extend(self, kpis: Iterable[KPI]) -> "KPICollection":
+        """
+        Добавляет несколько KPI (возвращает новую коллекцию).
+
+        Список копируется один раз, а не на каждый KPI, как при цепочке add().
+        """
+        return self.model_copy(update={"kpis": [*self.kpis, *kpis]})
+
     def filter_by_type(self, kpi_type: KPIType) -> List[KPI]:
         """Фильтрует KPI по типу."""
         return [k for k in self.kpis if k.kpi_type == kpi_type]
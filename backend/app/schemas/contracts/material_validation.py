@@ -67,7 +67,7 @@ class PSDQuality(str, Enum):
 # ============================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationIssue:
     """Отдельная проблема валидации."""
 
@@ -94,7 +94,7 @@ class ValidationIssue:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Результат валидации материала."""
 
@@ -107,9 +107,15 @@ class ValidationResult:
     @classmethod
     def from_issues(cls, issues: List[ValidationIssue]) -> "ValidationResult":
         """Создать результат из списка проблем."""
-        errors = sum(1 for i in issues if i.severity == ValidationSeverity.ERROR)
-        warnings = sum(1 for i in issues if i.severity == ValidationSeverity.WARNING)
-        infos = sum(1 for i in issues if i.severity == ValidationSeverity.INFO)
+        errors = warnings = infos = 0
+        for issue in issues:
+            severity = issue.severity
+            if severity == ValidationSeverity.ERROR:
+                errors += 1
+            elif severity == ValidationSeverity.WARNING:
+                warnings += 1
+            elif severity == ValidationSeverity.INFO:
+                infos += 1
 
         return cls(
             is_valid=errors == 0,
@@ -156,7 +162,7 @@ class ValidationResult:
 # ============================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class PSDMetrics:
     """Метрики качества PSD."""
 
@@ -235,7 +241,7 @@ def compute_psd_metrics(psd: PSD) -> PSDMetrics:
     issues = []
 
     # Проверка монотонности
-    is_monotonic = all(passings[i] <= passings[i + 1] for i in range(n - 1))
+    is_monotonic = all(a <= b for a, b in zip(passings, passings[1:]))
     if not is_monotonic:
         issues.append("cum_passing не монотонно возрастает")
 
@@ -245,31 +251,20 @@ def compute_psd_metrics(psd: PSD) -> PSDMetrics:
     if passings[0] > 30:
         issues.append(f"Минимальный cum_passing={passings[0]:.1f}%, нет данных в мелком классе")
 
-    # Квантили
+    # Квантили — одним проходом по точкам
     try:
-        p10 = psd.get_pxx(10)
-        p50 = psd.get_pxx(50)
-        p80 = psd.get_pxx(80)
-        p90 = psd.get_pxx(90)
+        p10, p20, p50, p60, p80, p90 = psd.get_pxx_many((10, 20, 50, 60, 80, 90))
     except (ValueError, IndexError):
-        p10 = p50 = p80 = p90 = None
+        p10 = p20 = p50 = p60 = p80 = p90 = None
         issues.append("Не удалось вычислить квантили")
 
     # Span и UC
     span = None
     uc = None
-    if p10 and p50 and p80:
-        try:
-            p20 = psd.get_pxx(20)
-            span = (p80 - p20) / p50 if p50 > 0 else None
-        except Exception:
-            pass
-    if p10:
-        try:
-            p60 = psd.get_pxx(60)
-            uc = p60 / p10 if p10 > 0 else None
-        except Exception:
-            pass
+    if p10 and p50 and p80 and p20 is not None:
+        span = (p80 - p20) / p50 if p50 > 0 else None
+    if p10 and p60 is not None:
+        uc = p60 / p10 if p10 > 0 else None
 
     # Определение качества
     quality = _assess_psd_quality(n, decades, is_monotonic, passings, issues)
@@ -11,7 +11,7 @@ from __future__ import annotations
 
 import math
 from enum import Enum
-from typing import Annotated, List, Optional
+from typing import Annotated, List, Optional, Sequence
 
 from pydantic import BaseModel, Field, computed_field, model_validator
 
@@ -155,33 +155,53 @@ class PSD(BaseModel):
         # Находим интервал для интерполяции
         for i in range(1, len(points)):
             if points[i].cum_passing >= percent:
-                p1, p2 = points[i - 1], points[i]
-
-                if self.interpolation == PSDInterpolation.LINEAR:
-                    # Линейная интерполяция
-                    t = (percent - p1.cum_passing) / (p2.cum_passing - p1.cum_passing)
-                    return p1.size_mm + t * (p2.size_mm - p1.size_mm)
-
-                elif self.interpolation == PSDInterpolation.LOG_LINEAR:
-                    # Логарифмическая по размеру, линейная по проценту
-                    if p1.size_mm <= 0 or p2.size_mm <= 0:
-                        # Fallback to linear
-                        t = (percent - p1.cum_passing) / (p2.cum_passing - p1.cum_passing)
-                        return p1.size_mm + t * (p2.size_mm - p1.size_mm)
-
-                    t = (percent - p1.cum_passing) / (p2.cum_passing - p1.cum_passing)
-                    log_size = math.log(p1.size_mm) + t * (
-                        math.log(p2.size_mm) - math.log(p1.size_mm)
-                    )
-                    return math.exp(log_size)
-
-                else:
-                    # SPLINE — требует scipy, fallback to linear
-                    t = (percent - p1.cum_passing) / (p2.cum_passing - p1.cum_passing)
-                    return p1.size_mm + t * (p2.size_mm - p1.size_mm)
+                return self._interpolate_size(points[i - 1], points[i], percent)
 
         return None
 
+    def get_pxx_many(self, percents: Sequence[float]) -> List[Optional[float]]:
+        """
+        Интерполирует размеры сразу для нескольких процентов прохода.
+
+        Результат совпадает с [get_pxx(p) for p in percents], но точки
+        проходятся один раз для всех процентов, а не заново для каждого.
+        """
+        for percent in percents:
+            if not 0 <= percent <= 100:
+                raise ValueError(f"percent должен быть 0-100, получено {percent}")
+
+        points = self.points
+        first, last = points[0], points[-1]
+        result: List[Optional[float]] = [None] * len(percents)
+
+        i = 1
+        for idx in sorted(range(len(percents)), key=percents.__getitem__):
+            percent = percents[idx]
+            if percent <= first.cum_passing:
+                result[idx] = first.size_mm
+                continue
+            if percent >= last.cum_passing:
+                result[idx] = last.size_mm
+                continue
+            while points[i].cum_passing < percent:
+                i += 1
+            result[idx] = self._interpolate_size(points[i - 1], points[i], percent)
+
+        return result
+
+    def _interpolate_size(self, p1: PSDPoint, p2: PSDPoint, percent: float) -> float:
+        """Размер между соседними точками p1, p2 для заданного процента прохода."""
+        t = (percent - p1.cum_passing) / (p2.cum_passing - p1.cum_passing)
+
+        if self.interpolation == PSDInterpolation.LOG_LINEAR and p1.size_mm > 0 and p2.size_mm > 0:
+            # Логарифмическая по размеру, линейная по проценту
+            log_size = math.log(p1.size_mm) + t * (math.log(p2.size_mm) - math.log(p1.size_mm))
+            return math.exp(log_size)
+
+        # LINEAR; LOG_LINEAR с неположительным размером и SPLINE (требует scipy)
+        # — линейная интерполяция
+        return p1.size_mm + t * (p2.size_mm - p1.size_mm)
+
     @computed_field
     @property
     def p80(self) -> Optional[float]:
@@ -196,13 +216,14 @@ class PSD(BaseModel):
 
     def compute_quantiles(self) -> PSDQuantiles:
         """Вычисляет стандартные квантили."""
+        p10, p20, p50, p80, p90, p95 = self.get_pxx_many((10, 20, 50, 80, 90, 95))
         return PSDQuantiles(
-            p10=self.get_pxx(10),
-            p20=self.get_pxx(20),
-            p50=self.get_pxx(50),
-            p80=self.get_pxx(80),
-            p90=self.get_pxx(90),
-            p95=self.get_pxx(95),
+            p10=p10,
+            p20=p20,
+            p50=p50,
+            p80=p80,
+            p90=p90,
+            p95=p95,
             p100=self.points[-1].size_mm if self.points else None,
         )
 
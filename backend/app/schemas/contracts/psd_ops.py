@@ -337,10 +337,7 @@ def compute_psd_stats(psd: PSD) -> PSDStats:
     Returns:
         PSDStats с d50, d_mean, span, uniformity_coefficient
     """
-    p10 = psd.get_pxx(10)
-    p50 = psd.get_pxx(50)
-    p60 = psd.get_pxx(60)
-    p90 = psd.get_pxx(90)
+    p10, p50, p60, p90 = psd.get_pxx_many((10, 50, 60, 90))
 
     # Span = (P90 - P10) / P50
     span = None
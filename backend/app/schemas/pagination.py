@@ -1,5 +1,5 @@
 # Pagination schemas for paginated API responses
-from typing import Generic, List, TypeVar
+from typing import Generic, List, Optional, TypeVar
 
 from pydantic import BaseModel, Field
 
@@ -24,6 +24,9 @@ class PaginatedResponse(BaseModel, Generic[T]):
     skip: int = Field(..., ge=0, description="Number of items skipped")
     limit: int = Field(..., ge=1, le=100, description="Number of items returned")
     items: List[T] = Field(..., description="List of items")
+    next_cursor: Optional[str] = Field(
+        default=None, description="Keyset cursor for the next page (None on the last page)"
+    )
 
     @property
     def has_more(self) -> bool:
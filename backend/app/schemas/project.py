@@ -48,6 +48,7 @@ class ProjectListItem(ProjectRead):
 class ProjectListResponse(BaseModel):
     items: List[ProjectListItem]
     total: int
+    next_cursor: Optional[int] = None
 
 
 class ProjectDetail(ProjectRead):
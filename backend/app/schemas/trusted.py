@@ -0,0 +1,43 @@
+"""
+Fast ORM -> read schema conversion for rows already typed by the DB layer.
+"""
+
+from functools import cache
+from operator import attrgetter
+from typing import Any, ClassVar, TypeVar
+
+from pydantic import BaseModel
+
+# Switch off if read schemas gain validators that must run on DB rows: the trusted
+# path skips them.
+TRUSTED_ORM_CONSTRUCT = True
+
+TrustedModelT = TypeVar("TrustedModelT", bound="TrustedOrmModel")
+
+
+@cache
+def _orm_field_getter(model: type[BaseModel]) -> tuple[tuple[str, ...], attrgetter]:
+    """Field names of ``model`` and a C-level getter that reads them in one call."""
+    names = tuple(model.model_fields)
+    return names, attrgetter(*names)
+
+
+class TrustedOrmModel(BaseModel):
+    """Base for read models built from ORM rows."""
+
+    # JSON columns that are still validated: legacy rows may not match the schema.
+    _json_models: ClassVar[dict[str, type[BaseModel]]] = {}
+
+    model_config = {"defer_build": True}
+
+    @classmethod
+    def from_orm_trusted(cls: type[TrustedModelT], obj: Any) -> TrustedModelT:
+        """Build from an ORM row via model_construct, without revalidating its columns."""
+        if not TRUSTED_ORM_CONSTRUCT:
+            return cls.model_validate(obj, from_attributes=True)
+        names, getter = _orm_field_getter(cls)
+        data = dict(zip(names, getter(obj)))
+        for name, json_model in cls._json_models.items():
+            if data[name] is not None:
+                data[name] = json_model.model_validate(data[name])
+        return cls.model_construct(**data)
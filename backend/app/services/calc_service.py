@@ -311,7 +311,7 @@ def run_flowsheet_calculation(db: Session, payload: CalcRunCreate) -> CalcRunRea
         )
         logger.exception("Unexpected calculation error")
         raise
-    return CalcRunRead.model_validate(calc_run, from_attributes=True)
+    return CalcRunRead.from_orm_trusted(calc_run)
 
 
 def run_flowsheet_calculation_by_scenario(
@@ -0,0 +1,33 @@
+"""Add comment (project_id, created_at DESC) index
+
+Revision ID: 3f1d2c9a7b40
+Revises: 6c2ec0cc1b58
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f1d2c9a7b40"
+down_revision: Union[str, Sequence[str], None] = "6c2ec0cc1b58"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_comment_project_id_created_at",
+        "comment",
+        ["project_id", sa.text("created_at DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_comment_project_id_created_at", table_name="comment")
@@ -11,6 +11,7 @@ ROOT_DIR = Path(__file__).resolve().parents[1]
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
+from app.core.cache import response_cache  # noqa: E402
 from app.core.rate_limit import limiter  # noqa: E402
 from app.db import Base, engine  # noqa: E402
 from app.main import app  # noqa: E402
@@ -21,12 +22,14 @@ def clean_db():
     """
     Перед каждым тестом пересоздаём структуру БД,
     чтобы тесты не влияли друг на друга.
-    Также сбрасываем rate limiter, чтобы лимиты не накапливались между тестами.
+    Также сбрасываем rate limiter, чтобы лимиты не накапливались между тестами,
+    и кеш ответов, чтобы id пересозданных проектов не попадали на старые записи.
     """
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
     # Сброс rate limiter storage для изоляции тестов
     limiter.reset()
+    response_cache.clear()
     yield
     # после теста можно не дропать — всё равно пересоздадим перед следующим
 
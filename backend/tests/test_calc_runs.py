@@ -109,6 +109,32 @@ def test_get_calc_runs_list(client: TestClient):
         assert "throughput_tph" in item["result_json"]
 
 
+def test_calc_run_trusted_construct_matches_validation(client: TestClient):
+    from app import models
+    from app.db import SessionLocal
+    from app.schemas.calc_run import CalcRunListItem, CalcRunRead
+
+    plant_id = create_plant(client)
+    flowsheet_id = create_flowsheet(client, plant_id)
+    flowsheet_version_id = create_flowsheet_version(client, flowsheet_id)
+    resp = client.post(
+        "/api/calc/flowsheet-run",
+        json={
+            "flowsheet_version_id": flowsheet_version_id,
+            "input_json": {"feed_tph": 120, "target_p80_microns": 160},
+        },
+    )
+    assert resp.status_code in (200, 201)
+
+    with SessionLocal() as db:
+        run = db.get(models.CalcRun, uuid.UUID(resp.json()["id"]))
+        for schema in (CalcRunRead, CalcRunListItem):
+            trusted = schema.from_orm_trusted(run)
+            validated = schema.model_validate(run, from_attributes=True)
+            assert trusted.model_dump() == validated.model_dump()
+            assert isinstance(trusted.input_json, type(validated.input_json))
+
+
 def test_compare_calc_runs(client: TestClient):
     plant_id = create_plant(client)
     flowsheet_id = create_flowsheet(client, plant_id)
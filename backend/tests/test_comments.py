@@ -113,6 +113,32 @@ def test_create_comment_for_run(client: TestClient):
     assert any(item["id"] == body["id"] for item in list_resp.json()["items"])
 
 
+def test_trusted_read_models_match_validation(client: TestClient):
+    from app import models
+    from app.db import SessionLocal
+    from app.schemas import CalcScenarioListItem, CalcScenarioRead, CommentRead
+
+    headers = _auth_headers(client, "trusted-reader@example.com")
+    project_id, scenario_id, _ = _setup_project_resources(client, headers)
+    resp = client.post(
+        f"/api/projects/{project_id}/comments",
+        json={"scenario_id": scenario_id, "text": "Trusted"},
+        headers=headers,
+    )
+    assert resp.status_code in (200, 201)
+
+    with SessionLocal() as db:
+        scenario = db.get(models.CalcScenario, uuid.UUID(scenario_id))
+        comment = db.get(models.Comment, uuid.UUID(resp.json()["id"]))
+        for schema, row in (
+            (CalcScenarioRead, scenario),
+            (CalcScenarioListItem, scenario),
+            (CommentRead, comment),
+        ):
+            trusted = schema.from_orm_trusted(row)
+            assert trusted.model_dump() == schema.model_validate(row, from_attributes=True).model_dump()
+
+
 def test_reject_multiple_targets(client: TestClient):
     headers = _auth_headers(client, "multi@example.com")
     project_id, scenario_id, run_id = _setup_project_resources(client, headers)
@@ -1,6 +1,6 @@
 ﻿from fastapi.testclient import TestClient
 
-from .utils import create_flowsheet, create_flowsheet_version, create_plant
+from .utils import create_flowsheet, create_flowsheet_version, create_plant, create_unit
 
 
 def test_plant_crud(client: TestClient):
@@ -162,3 +162,26 @@ def test_unit_crud(client: TestClient):
     # optional read after delete
     resp = client.get(f"/api/units/{unit_id}")
     assert resp.status_code in (200, 404, 410)
+
+
+def test_units_keyset_pagination(client: TestClient):
+    plant_id = create_plant(client)
+    fs_id = create_flowsheet(client, plant_id)
+    fsv_id = create_flowsheet_version(client, fs_id)
+    created_ids = {create_unit(client, fsv_id) for _ in range(5)}
+
+    seen: list[str] = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor is not None:
+            params["cursor"] = cursor
+        page = client.get("/api/units/", params=params).json()
+        assert page["total"] == 5
+        seen.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(seen) == 5
+    assert set(seen) == created_ids
@@ -24,6 +24,7 @@ from app.schemas.contracts import (
     Material,
     MaterialPhase,
     MaterialQuality,
+    PSDInterpolation,
     PSDPoint,
     Stream,
     StreamType,
@@ -99,6 +100,16 @@ class TestPSD:
         # P80 должен быть между 0.600 и 1.180 (75% и 90%)
         assert 0.6 < p80 < 1.18
 
+    @pytest.mark.parametrize("interpolation", list(PSDInterpolation))
+    def test_psd_get_pxx_many_matches_get_pxx(self, sample_psd: PSD, interpolation):
+        """get_pxx_many совпадает с поштучным get_pxx в любом порядке процентов."""
+        psd = sample_psd.model_copy(update={"interpolation": interpolation})
+        percents = (90, 5, 50, 15, 100, 80, 0, 99, 55, 20)
+
+        assert psd.get_pxx_many(percents) == [psd.get_pxx(p) for p in percents]
+        with pytest.raises(ValueError):
+            psd.get_pxx_many((50, 101))
+
     def test_psd_p80_property(self, sample_psd: PSD):
         """Свойство p80 работает."""
         assert sample_psd.p80 is not None
@@ -372,6 +383,19 @@ class TestKPI:
         assert kpi_with_bl.baseline_value == 1500.0
         assert kpi_with_bl.delta_from_baseline == 100.0
 
+    def test_kpi_cached_values_follow_copy_update(self):
+        """Кэш status/delta не переносится в копию с обновлёнными полями."""
+        kpi = KPI(key="energy", value=14.0, target_value=12.0)
+        assert kpi.status == KPIStatus.WARNING
+        assert kpi.delta_percent is None
+
+        updated = kpi.with_baseline(10.0).model_copy(update={"value": 12.0})
+
+        assert updated.status == KPIStatus.OK
+        assert updated.delta_percent == pytest.approx(20.0)
+        assert updated.model_dump()["status"] == KPIStatus.OK
+        assert kpi.status == KPIStatus.WARNING
+
 
 class TestKPICollection:
     """Тесты для KPICollection."""
@@ -410,6 +434,16 @@ class TestKPICollection:
         assert len(new_collection.kpis) == 4
         assert new_collection["recovery"] == 92.0
 
+    def test_collection_extend(self, sample_collection: KPICollection):
+        """extend() добавляет несколько KPI, не меняя исходную коллекцию."""
+        new_collection = sample_collection.extend(
+            KPI(key=f"extra_{i}", value=float(i)) for i in range(3)
+        )
+
+        assert len(new_collection.kpis) == 6
+        assert new_collection["extra_2"] == 2.0
+        assert len(sample_collection.kpis) == 3
+
     def test_collection_filter_by_type(self, sample_collection: KPICollection):
         """Фильтр по типу."""
         energy_kpis = sample_collection.filter_by_type(KPIType.ENERGY)
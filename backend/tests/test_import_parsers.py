@@ -157,6 +157,21 @@ class TestCSVRetained:
         assert result.psd.points[-1].cum_passing == pytest.approx(100.0, abs=0.1)
         assert result.psd.points[0].cum_passing == pytest.approx(0.0, abs=0.1)
 
+    def test_parse_retained_accumulates(self):
+        """Без cum_retained_pct накопленный остаток считается нарастающим итогом."""
+        content = """size_mm,retained_pct
+4.75,5.0
+3.35,10.0
+2.36,15.0
+1.7,20.0
+1.18,15.0
+"""
+        result = parse_csv_retained(content)
+
+        assert result.success
+        passing = [p.cum_passing for p in sorted(result.psd.points, key=lambda p: -p.size_mm)]
+        assert passing == pytest.approx([95.0, 85.0, 70.0, 50.0, 35.0])
+
     def test_parse_from_file(self):
         """Парсинг retained из файла."""
         file_path = TEST_DATA_DIR / "sieve_analysis_retained.csv"
@@ -390,6 +405,11 @@ class TestAutoDetection:
         assert result.success
         assert result.format_detected == ImportFormat.JSON_PSD
 
+        # Ведущие пробелы и переводы строк не мешают автоопределению
+        result = import_psd("\n  \n" + content + "\n")
+        assert result.success
+        assert result.format_detected == ImportFormat.JSON_PSD
+
     def test_detect_by_filename(self):
         """Определение формата по имени файла."""
         csv_content = """size_mm,cum_passing
@@ -453,6 +473,31 @@ class TestValidation:
         # Точка с отрицательным размером пропускается
         assert len(result.errors) > 0
 
+    def test_short_row_error(self):
+        """Строка без нужной колонки — ошибка строки, а не исключение."""
+        content = """cum_passing,size_mm
+100.0,6.0
+85.0
+65.0,2.0
+45.0,1.0
+25.0,0.5
+"""
+        result = parse_csv_simple(content)
+
+        assert result.success
+        assert len(result.psd.points) == 4
+        assert result.errors and result.errors[0].startswith("Row 3:")
+
+    def test_crlf_line_endings(self):
+        """CSV с переводами строк Windows и метаданными."""
+        content = "# SG: 2.7\r\nsize_mm,cum_passing\r\n6.0,100.0\r\n4.0,85.0\r\n\r\n2.0,65.0\r\n1.0,45.0\r\n"
+        result = parse_csv_simple(content)
+
+        assert result.success
+        assert result.metadata.specific_gravity == 2.7
+        assert len(result.psd.points) == 4
+        assert not result.errors
+
     def test_parse_invalid_files(self):
         """Проверка обработки невалидных файлов."""
         # Bad values
@@ -10,3 +10,41 @@ def test_me_dashboard_anonymous(client: TestClient):
     assert body["summary"]["projects_total"] == 0
     assert body["projects"] == []
     assert body["member_projects"] == []
+
+
+def test_me_summary_counts_runs_by_status(client: TestClient):
+    import uuid
+
+    from app import models
+    from app.db import SessionLocal
+
+    from .utils import create_flowsheet, create_flowsheet_version, create_plant
+
+    reg = client.post(
+        "/api/auth/register",
+        json={"email": "me-summary@example.com", "full_name": "Me", "password": "secret123"},
+    )
+    assert reg.status_code in (200, 201)
+    token = client.post(
+        "/api/auth/token",
+        data={"username": "me-summary@example.com", "password": "secret123"},
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    ).json()["access_token"]
+    version_id = create_flowsheet_version(client, create_flowsheet(client, create_plant(client)))
+
+    with SessionLocal() as db:
+        for status in ("success", "success", "failed"):
+            db.add(
+                models.CalcRun(
+                    flowsheet_version_id=uuid.UUID(version_id),
+                    started_by_user_id=uuid.UUID(reg.json()["id"]),
+                    status=status,
+                )
+            )
+        db.commit()
+
+    resp = client.get("/api/auth/me/summary", headers={"Authorization": f"Bearer {token}"})
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["calc_runs_total"] == 3
+    assert body["calc_runs_by_status"] == {"success": 2, "failed": 1}
@@ -43,6 +43,43 @@ def test_create_and_list_my_projects(client: TestClient):
     assert all(item["owner_user_id"] == user_id for item in list_body["items"])
 
 
+def test_my_projects_keyset_pagination(client: TestClient):
+    _, token = _register_and_token(client, "keyset@example.com", "secret123")
+    headers = {"Authorization": f"Bearer {token}"}
+    created_ids = []
+    for i in range(5):
+        resp = client.post("/api/projects", json={"name": f"Keyset {i}"}, headers=headers)
+        assert resp.status_code == 201
+        created_ids.append(resp.json()["id"])
+
+    seen: list[int] = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor is not None:
+            params["cursor"] = cursor
+        page = client.get("/api/projects/my", params=params, headers=headers).json()
+        assert page["total"] == 5
+        seen.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert sorted(seen) == sorted(created_ids)
+    assert len(seen) == len(set(seen))
+
+    bad = client.get("/api/projects/my", params={"cursor": 999999}, headers=headers)
+    assert bad.status_code == 400
+
+    # Another user's project id is indistinguishable from a missing one.
+    _, other_token = _register_and_token(client, "keyset-other@example.com", "secret123")
+    other_headers = {"Authorization": f"Bearer {other_token}"}
+    foreign = client.get(
+        "/api/projects/my", params={"cursor": created_ids[0]}, headers=other_headers
+    )
+    assert foreign.status_code == 400
+
+
 def test_attach_flowsheet_version_and_get_detail(client: TestClient):
     user_id, token = _register_and_token(client, "detail@example.com", "secret123")
     headers = {"Authorization": f"Bearer {token}"}
@@ -275,6 +312,122 @@ def test_project_summary_with_activity(client: TestClient):
     assert summary["last_activity_at"] is not None
 
 
+def test_project_summary_counts_runs_by_status(client: TestClient):
+    user_id, token = _register_and_token(client, "summary-status@example.com", "secret123")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    plant_id = create_plant(client)
+    flowsheet_id = create_flowsheet(client, plant_id)
+    flowsheet_version_id = create_flowsheet_version(client, flowsheet_id)
+    project_resp = client.post("/api/projects", json={"name": "Statuses"}, headers=headers)
+    assert project_resp.status_code == 201
+    project_id = project_resp.json()["id"]
+    attach_resp = client.post(
+        f"/api/projects/{project_id}/flowsheet-versions/{flowsheet_version_id}",
+        headers=headers,
+    )
+    assert attach_resp.status_code in (200, 201)
+
+    started_at = datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    with SessionLocal() as db:
+        for status in ("success", "success", "failed", "pending"):
+            db.add(
+                models.CalcRun(
+                    flowsheet_version_id=uuid.UUID(flowsheet_version_id),
+                    project_id=project_id,
+                    status=status,
+                    started_at=started_at if status != "pending" else None,
+                )
+            )
+        db.commit()
+
+    summary_resp = client.get(f"/api/projects/{project_id}/summary", headers=headers)
+    assert summary_resp.status_code == 200
+    summary = summary_resp.json()
+    assert summary["calc_runs_total"] == 4
+    assert summary["calc_runs_by_status"] == {"success": 2, "failed": 1, "pending": 1}
+    assert summary["scenarios_total"] == 0
+    assert summary["comments_total"] == 0
+    assert summary["last_activity_at"].startswith("2025-01-02T03:04:05")
+
+
+def test_project_summary_cache_invalidated_on_write(client: TestClient):
+    user_id, token = _register_and_token(client, "summary-cache@example.com", "secret123")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    plant_id = create_plant(client)
+    flowsheet_id = create_flowsheet(client, plant_id)
+    flowsheet_version_id = create_flowsheet_version(client, flowsheet_id)
+    project_resp = client.post("/api/projects", json={"name": "Cached"}, headers=headers)
+    assert project_resp.status_code == 201
+    project_id = project_resp.json()["id"]
+    attach_resp = client.post(
+        f"/api/projects/{project_id}/flowsheet-versions/{flowsheet_version_id}",
+        headers=headers,
+    )
+    assert attach_resp.status_code in (200, 201)
+
+    first = client.get(f"/api/projects/{project_id}/summary", headers=headers).json()
+    assert first["calc_runs_total"] == 0
+    dashboard = client.get(f"/api/projects/{project_id}/dashboard", headers=headers).json()
+    assert dashboard["recent_calc_runs"] == []
+
+    with SessionLocal() as db:
+        db.add(
+            models.CalcRun(
+                flowsheet_version_id=uuid.UUID(flowsheet_version_id),
+                project_id=project_id,
+                status="success",
+            )
+        )
+        db.commit()
+
+    second = client.get(f"/api/projects/{project_id}/summary", headers=headers).json()
+    assert second["calc_runs_total"] == 1
+    dashboard = client.get(f"/api/projects/{project_id}/dashboard", headers=headers).json()
+    assert len(dashboard["recent_calc_runs"]) == 1
+
+
+def test_project_summary_cache_skips_store_after_concurrent_write(client: TestClient, monkeypatch):
+    from app.routers import projects as projects_router
+
+    _, token = _register_and_token(client, "summary-race@example.com", "secret123")
+    headers = {"Authorization": f"Bearer {token}"}
+    plant_id = create_plant(client)
+    flowsheet_id = create_flowsheet(client, plant_id)
+    flowsheet_version_id = create_flowsheet_version(client, flowsheet_id)
+    project_id = client.post("/api/projects", json={"name": "Race"}, headers=headers).json()["id"]
+    attach_resp = client.post(
+        f"/api/projects/{project_id}/flowsheet-versions/{flowsheet_version_id}",
+        headers=headers,
+    )
+    assert attach_resp.status_code in (200, 201)
+
+    original = projects_router._calculate_project_summary
+
+    def summary_then_concurrent_write(*args, **kwargs):
+        # A write commits after the payload was computed but before it is cached.
+        summary = original(*args, **kwargs)
+        with SessionLocal() as db:
+            db.add(
+                models.CalcRun(
+                    flowsheet_version_id=uuid.UUID(flowsheet_version_id),
+                    project_id=project_id,
+                    status="success",
+                )
+            )
+            db.commit()
+        return summary
+
+    monkeypatch.setattr(projects_router, "_calculate_project_summary", summary_then_concurrent_write)
+    stale = client.get(f"/api/projects/{project_id}/summary", headers=headers).json()
+    assert stale["calc_runs_total"] == 0
+    monkeypatch.setattr(projects_router, "_calculate_project_summary", original)
+
+    fresh = client.get(f"/api/projects/{project_id}/summary", headers=headers).json()
+    assert fresh["calc_runs_total"] == 1
+
+
 def test_project_summary_forbidden_and_unauthorized(client: TestClient):
     user1_id, token1 = _register_and_token(client, "sum-owner@example.com", "secret123")
     user2_id, token2 = _register_and_token(client, "sum-other@example.com", "secret123")
@@ -352,6 +505,38 @@ def test_non_owner_cannot_add_member(client: TestClient):
     assert add_resp.status_code == 403
 
 
+def test_add_member_is_idempotent_and_unknown_email_404(client: TestClient):
+    owner_id, owner_token = _register_and_token(client, "owner_readd@example.com", "secret123")
+    _register_and_token(client, "member_readd@example.com", "secret123")
+    headers_owner = {"Authorization": f"Bearer {owner_token}"}
+
+    project_resp = client.post("/api/projects", json={"name": "Re-add"}, headers=headers_owner)
+    assert project_resp.status_code == 201
+    project_id = project_resp.json()["id"]
+
+    first = client.post(
+        f"/api/projects/{project_id}/members",
+        json={"email": "member_readd@example.com", "role": "viewer"},
+        headers=headers_owner,
+    )
+    assert first.status_code == 201
+    again = client.post(
+        f"/api/projects/{project_id}/members",
+        json={"email": "member_readd@example.com", "role": "editor"},
+        headers=headers_owner,
+    )
+    assert again.status_code == 201
+    assert again.json()["role"] == "viewer"
+    assert again.json()["added_at"] == first.json()["added_at"]
+
+    missing = client.post(
+        f"/api/projects/{project_id}/members",
+        json={"email": "nobody@example.com", "role": "editor"},
+        headers=headers_owner,
+    )
+    assert missing.status_code == 404
+
+
 def test_list_members(client: TestClient):
     owner_id, owner_token = _register_and_token(client, "owner_list@example.com", "secret123")
     member_id, member_token = _register_and_token(client, "member_list@example.com", "secret123")